@@ -1,3 +1,12 @@
+import sys
+import time
+import tracemalloc
+from array import array
+from itertools import repeat
+from operator import add
+from typing import Iterable
+
+
 class Plant:
     def __init__(self, name: str, height: int, age: int):
         self.name = name
@@ -17,6 +26,150 @@ class Plant:
         print(self)
 
 
+class PlantView:
+    __slots__ = ("_population", "_index")
+
+    def __init__(self, population: "PlantPopulation", index: int):
+        self._population = population
+        self._index = index
+
+    @property
+    def name(self) -> str:
+        population = self._population
+        return population.names[population.name_ids[self._index]]
+
+    @property
+    def height(self) -> int:
+        population = self._population
+        return population.heights[self._index] + population.height_offset
+
+    @height.setter
+    def height(self, value: int) -> None:
+        population = self._population
+        population.heights[self._index] = value - population.height_offset
+
+    @property
+    def age(self) -> int:
+        population = self._population
+        return population.ages[self._index] + population.age_offset
+
+    @age.setter
+    def age(self, value: int) -> None:
+        population = self._population
+        population.ages[self._index] = value - population.age_offset
+
+    def __repr__(self):
+        return F"{self.name}: {self.height}cm, {self.age} days old"
+
+    def grow(self):
+        self.height += 1
+
+    def age_up(self):
+        self.age += 1
+
+    def get_info(self):
+        print(self)
+
+
+class PlantPopulation:
+    def __init__(self):
+        self.names: list[str] = []
+        self._name_ids: dict[str, int] = {}
+        self.name_ids = array("I")
+        self.heights = array("q")
+        self.ages = array("q")
+        self.height_offset = 0
+        self.age_offset = 0
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    def __getitem__(self, index: int) -> PlantView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("plant index out of range")
+        return PlantView(self, index % len(self))
+
+    def __iter__(self):
+        return (PlantView(self, i) for i in range(len(self)))
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def add(self, name: str, height: int, age: int) -> PlantView:
+        self.name_ids.append(self._name_id(name))
+        self.heights.append(height - self.height_offset)
+        self.ages.append(age - self.age_offset)
+        return PlantView(self, len(self) - 1)
+
+    def add_many(self, name: str, heights: Iterable[int],
+                 ages: Iterable[int]) -> None:
+        start = len(self)
+        self.materialize()
+        self.heights.extend(heights)
+        self.ages.extend(ages)
+        count = len(self) - start
+        self.name_ids.extend(repeat(self._name_id(name), count))
+
+    def grow_all(self, days: int = 1) -> None:
+        self.height_offset += days
+
+    def age_all(self, days: int = 1) -> None:
+        self.age_offset += days
+
+    def materialize(self) -> None:
+        if self.height_offset:
+            self.heights[:] = array("q", map(add, self.heights,
+                                             repeat(self.height_offset)))
+            self.height_offset = 0
+        if self.age_offset:
+            self.ages[:] = array("q", map(add, self.ages,
+                                          repeat(self.age_offset)))
+            self.age_offset = 0
+
+
+def benchmark(n: int = 1_000_000, days: int = 7) -> None:
+    print(F"=== Plant Population Benchmark: {n} plants ===")
+    tracemalloc.start()
+    garden = [Plant("Rose", 25, 30) for _ in range(n)]
+    objects_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(days):
+        for plant in garden:
+            plant.grow()
+            plant.age_up()
+    objects_time = time.perf_counter() - start
+    del garden
+    tracemalloc.start()
+    population = PlantPopulation()
+    population.add_many("Rose", repeat(25, n), repeat(30, n))
+    population_mem = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(days):
+        population.grow_all()
+        population.age_all()
+    population.materialize()
+    population_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(days):
+        population.grow_all()
+        population.age_all()
+        population.materialize()
+    daily_time = time.perf_counter() - start
+    print(F"Plant objects: {objects_mem / n:.1f} bytes/plant, "
+          F"{n * days / objects_time / 1e6:.2f}M plant-days/s")
+    print(F"PlantPopulation: {population_mem / n:.1f} bytes/plant, "
+          F"{n * days / population_time / 1e6:.2f}M plant-days/s "
+          F"(materialized once), "
+          F"{n * days / daily_time / 1e6:.2f}M plant-days/s "
+          F"(materialized daily)")
+
+
 def main():
     rose = Plant("Rose", 25, 30)
     start_height = rose.height
@@ -31,4 +184,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        main()
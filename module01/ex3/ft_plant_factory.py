@@ -1,9 +1,23 @@
+import csv
+import io
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Generator, Iterable, TextIO
+
+LOG_BATCH = 4096
+
+
 class Plant:
-    def __init__(self, name: str, height: int, age: int):
+    def __init__(self, name: str, height: int, age: int, log: bool = True):
         self.name = name
         self.height = height
         self.age = age
-        print(F"Created: {name} ({height}cm, {age} days)")
+        if log:
+            print(F"Created: {name} ({height}cm, {age} days)")
 
     def __repr__(self):
         return F"{self.name}: {self.height}cm, {self.age} days old"
@@ -18,6 +32,115 @@ class Plant:
         print(self)
 
 
+def read_seed_rows(source: TextIO, rejected: list[int] | None = None
+                   ) -> Generator[tuple, None, None]:
+    # malformed rows (wrong column count, header, non-integer field) are
+    # skipped; their line numbers go to rejected when it is given
+    reader = csv.reader(source)
+    for row in reader:
+        try:
+            name, height, age = row
+            plant = name, int(height), int(age)
+        except ValueError:
+            if rejected is not None:
+                rejected.append(reader.line_num)
+            continue
+        yield plant
+
+
+def plant_stream(rows: Iterable[tuple], log: str = "batch",
+                 batch_size: int = LOG_BATCH
+                 ) -> Generator[Plant, None, None]:
+    if log == "each":
+        for row in rows:
+            yield Plant(*row)
+        return
+    pending: list[str] = []
+    for name, height, age in rows:
+        if log == "batch":
+            pending.append(F"Created: {name} ({height}cm, {age} days)\n")
+            if len(pending) >= batch_size:
+                sys.stdout.write("".join(pending))
+                pending.clear()
+        yield Plant(name, height, age, log=False)
+    if pending:
+        sys.stdout.write("".join(pending))
+
+
+def load_columns(source: TextIO, rejected: list[int] | None = None
+                 ) -> tuple[list[str], array, array]:
+    names: list[str] = []
+    heights = array("q")
+    ages = array("q")
+    interned: dict[str, str] = {}
+    for name, height, age in read_seed_rows(source, rejected):
+        names.append(interned.setdefault(name, name))
+        heights.append(height)
+        ages.append(age)
+    return names, heights, ages
+
+
+def _load_range(path: str, start: int, end: int
+                ) -> tuple[list[str], array, array]:
+    with open(path, "rb") as f:
+        offsets = []
+        for bound in (start, end):
+            if bound:
+                f.seek(bound - 1)
+                f.readline()
+            offsets.append(f.tell())
+        f.seek(offsets[0])
+        data = f.read(max(0, offsets[1] - offsets[0]))
+    return load_columns(io.StringIO(data.decode()))
+
+
+def parallel_load_columns(path: str, workers: int | None = None
+                          ) -> tuple[list[str], array, array]:
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    bounds = [size * i // workers for i in range(workers + 1)]
+    names: list[str] = []
+    heights = array("q")
+    ages = array("q")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part in pool.map(_load_range, [path] * workers,
+                             bounds[:-1], bounds[1:]):
+            names.extend(part[0])
+            heights.extend(part[1])
+            ages.extend(part[2])
+    return names, heights, ages
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    print(F"=== Plant Factory Benchmark: {n} plants ===")
+    path = "benchmark_seeds.csv"
+    kinds = ["Rose", "Oak", "Cactus", "Sunflower", "Fern"]
+    with open(path, "w") as f:
+        f.writelines(F"{kinds[i % 5]},{i % 300},{i % 365}\n"
+                     for i in range(n))
+    try:
+        for log in ("each", "batch", "off"):
+            with open(path) as src, open(os.devnull, "w") as sink:
+                with redirect_stdout(sink):
+                    start = time.perf_counter()
+                    for _ in plant_stream(read_seed_rows(src), log):
+                        pass
+                    elapsed = time.perf_counter() - start
+            print(F"Logging {log}: {n / elapsed / 1e6:.2f}M plants/s")
+        start = time.perf_counter()
+        with open(path) as src:
+            load_columns(src)
+        print(F"Column loader: {n / (time.perf_counter() - start) / 1e6:.2f}"
+              F"M plants/s")
+        start = time.perf_counter()
+        names, _, _ = parallel_load_columns(path)
+        print(F"Parallel column loader: "
+              F"{len(names) / (time.perf_counter() - start) / 1e6:.2f}"
+              F"M plants/s")
+    finally:
+        os.remove(path)
+
+
 def main():
     plant_data = [
         ("Rose", 25, 30),
@@ -32,4 +155,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
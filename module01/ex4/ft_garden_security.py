@@ -1,3 +1,14 @@
+import os
+import random
+import sys
+import time
+from array import array
+from contextlib import redirect_stdout
+from itertools import compress
+from operator import and_, itemgetter, not_
+from typing import Iterable
+
+
 class SecurePlant:
     def __init__(self, name: str):
         self._name = name
@@ -30,6 +41,74 @@ class SecurePlant:
     def __repr__(self):
         return F"{self._name} ({self._height}cm, {self._age} days)"
 
+    @staticmethod
+    def bulk_update(plants: list["SecurePlant"],
+                    updates: Iterable[tuple[int, int, int]]) -> dict:
+        # plant_id indexes plants; height and age are validated separately,
+        # like the setters, and later updates for a plant win. Each rejected
+        # list holds positions in updates, not plant ids: unknown_plant for
+        # out-of-range plant_ids, height and age for negative values
+        updates = list(updates)
+        rejected = {"unknown_plant": array("q"), "height": array("q"),
+                    "age": array("q")}
+        report = {"updates": len(updates), "heights_applied": 0,
+                  "ages_applied": 0, "rejected": rejected}
+        if not updates:
+            return report
+        ids, heights, ages = (list(map(itemgetter(i), updates))
+                              for i in range(3))
+        known = None
+        if min(ids) < 0 or max(ids) >= len(plants):
+            known = [0 <= pid < len(plants) for pid in ids]
+            rejected["unknown_plant"].extend(
+                compress(range(len(ids)), map(not_, known)))
+        for field, values in (("height", heights), ("age", ages)):
+            accepted = None
+            if min(values) < 0:
+                accepted = list(map((0).__le__, values))
+                rejected[field].extend(
+                    compress(range(len(values)), map((0).__gt__, values)))
+            if known is not None:
+                accepted = known if accepted is None else \
+                    list(map(and_, accepted, known))
+            pairs = zip(ids, values)
+            if accepted is None:
+                latest = dict(pairs)
+                report[F"{field}s_applied"] = len(values)
+            else:
+                latest = dict(compress(pairs, accepted))
+                report[F"{field}s_applied"] = sum(accepted)
+            attr = "_" + field
+            for pid, value in latest.items():
+                setattr(plants[pid], attr, value)
+        return report
+
+
+def benchmark(updates: int = 1_000_000, plants: int = 10_000) -> None:
+    print(F"=== Secure Plant Bulk Update Benchmark: {updates} updates ===")
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        garden = [SecurePlant(F"plant_{i}") for i in range(plants)]
+    feed = [(random.randrange(plants), random.randint(-5, 500),
+             random.randint(-5, 3650)) for _ in range(updates)]
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        for pid, height, age in feed:
+            garden[pid].set_height(height)
+            garden[pid].set_age(age)
+        loop = time.perf_counter() - start
+    expected = [(plant.get_height(), plant.get_age()) for plant in garden]
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        garden = [SecurePlant(F"plant_{i}") for i in range(plants)]
+    start = time.perf_counter()
+    report = SecurePlant.bulk_update(garden, feed)
+    bulk = time.perf_counter() - start
+    assert expected == [(p.get_height(), p.get_age()) for p in garden]
+    print(F"Setter loop: {updates / loop / 1e6:.2f}M updates/s")
+    print(F"bulk_update: {updates / bulk / 1e6:.2f}M updates/s "
+          F"({loop / bulk:.1f}x)")
+    print(F"Rejected: {len(report['rejected']['height'])} heights, "
+          F"{len(report['rejected']['age'])} ages")
+
 
 def main():
     print("=== Garden Security System ===")
@@ -43,4 +122,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        main()
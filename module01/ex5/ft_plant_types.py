@@ -1,4 +1,15 @@
+import sys
+import tracemalloc
+
+
+def _intern(value):
+    # categorical strings are shared; anything else is stored as given
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Plant:
+    __slots__ = ("name", "height", "age")
+
     def __init__(self, name: str, height: int, age: int):
         self.name = name
         self.height = height
@@ -18,9 +29,11 @@ class Plant:
 
 
 class Flower(Plant):
+    __slots__ = ("color",)
+
     def __init__(self, name: str, height: int, age: int, color: str):
         super().__init__(name, height, age)
-        self.color = color
+        self.color = _intern(color)
 
     def bloom(self):
         print(F"{self.name} is blooming beatifully!")
@@ -31,6 +44,8 @@ class Flower(Plant):
 
 
 class Tree(Plant):
+    __slots__ = ("trunk_diameter",)
+
     def __init__(self, name: str, height: int, age: int, trunk_diameter: int):
         super().__init__(name, height, age)
         self.trunk_diameter = trunk_diameter
@@ -44,10 +59,12 @@ class Tree(Plant):
 
 
 class Vegetable(Plant):
+    __slots__ = ("harvest_season", "nutritional_value")
+
     def __init__(self, name: str, hgt: int, age: int, season: str, nutr: str):
         super().__init__(name, hgt, age)
-        self.harvest_season = season
-        self.nutritional_value = nutr
+        self.harvest_season = _intern(season)
+        self.nutritional_value = _intern(nutr)
 
     def __repr__(self):
         return (f"{self.name} (Vegetable): {self.height}cm, "
@@ -57,6 +74,48 @@ class Vegetable(Plant):
         print(F"{self.name} is rich in {self.nutritional_value}")
 
 
+class _DictPlant:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def measure(factory, n: int) -> float:
+    tracemalloc.start()
+    plants = [factory(i) for i in range(n)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del plants
+    return used / n
+
+
+def _fresh(text: str) -> str:
+    return "".join(list(text))
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    print(F"=== Plant Memory Benchmark: {n} instances per type ===")
+    seasons = ["summer", "autumn"]
+    cases = [
+        ("Flower",
+         lambda i: Flower("Rose", i, 30, _fresh("red")),
+         lambda i: _DictPlant(name="Rose", height=i, age=30,
+                              color=_fresh("red"))),
+        ("Tree",
+         lambda i: Tree("Oak", i, 1825, 50),
+         lambda i: _DictPlant(name="Oak", height=i, age=1825,
+                              trunk_diameter=50)),
+        ("Vegetable",
+         lambda i: Vegetable("Tomato", i, 90, _fresh(seasons[i % 2]),
+                             _fresh("vitamin C")),
+         lambda i: _DictPlant(name="Tomato", height=i, age=90,
+                              harvest_season=_fresh(seasons[i % 2]),
+                              nutritional_value=_fresh("vitamin C"))),
+    ]
+    for name, compact, baseline in cases:
+        print(F"{name}: {measure(compact, n):.1f} bytes (slots) vs "
+              F"{measure(baseline, n):.1f} bytes (dict)")
+
+
 def main():
     print("=== Garden Plant Types ===")
     rose = Flower("Rose", 25, 30, "red")
@@ -83,4 +142,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
@@ -1,4 +1,20 @@
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Iterable
+
+
+def _intern(value):
+    # categorical strings are shared; anything else is stored as given
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class Plant:
+    __slots__ = ("name", "height")
+
     def __init__(self, name: str, height: int):
         self.name = name
         self.height = height
@@ -12,16 +28,20 @@ class Plant:
 
 
 class FloweringPlant(Plant):
+    __slots__ = ("color", "status")
+
     def __init__(self, name: str, height: int, color: str, status: str):
         super().__init__(name, height)
-        self.color = color
-        self.status = status
+        self.color = _intern(color)
+        self.status = _intern(status)
 
     def __repr__(self):
         return f"{super().__repr__()}, {self.color} flowers {self.status}"
 
 
 class PrizeFlower(FloweringPlant):
+    __slots__ = ("points",)
+
     def __init__(self, name: str, height: int, color: str, status: str, point):
         super().__init__(name, height, color, status)
         self.points = point
@@ -35,15 +55,25 @@ class GardenManager:
         def __init__(self):
             self.gardenstats = {}
 
+        @staticmethod
+        def empty() -> dict:
+            return {
+                "total_growth": 0,
+                "plants_count": 0,
+                "regular": 0,
+                "flowering": 0,
+                "prize": 0,
+                "prize_points": 0,
+                "total_height": 0,
+                "min_height": None
+            }
+
         def add_garden(self, owner: str):
             if owner not in self.gardenstats:
-                self.gardenstats[owner] = {
-                    "total_growth": 0,
-                    "plants_count": 0,
-                    "regular": 0,
-                    "flowering": 0,
-                    "prize": 0
-                }
+                self.gardenstats[owner] = self.empty()
+
+        def get(self, owner: str) -> dict:
+            return self.gardenstats.get(owner) or self.empty()
 
         def add_plant(self, owner: str, plant):
             self.add_garden(owner)
@@ -53,22 +83,54 @@ class GardenManager:
                 p_type = "flowering"
             else:
                 p_type = "regular"
-            self.gardenstats[owner][p_type] += 1
-            self.gardenstats[owner]["plants_count"] += 1
+            stats = self.gardenstats[owner]
+            stats[p_type] += 1
+            stats["plants_count"] += 1
+            if p_type == "prize":
+                stats["prize_points"] += plant.points
+            stats["total_height"] += plant.height
+            if stats["min_height"] is None or \
+                    plant.height < stats["min_height"]:
+                stats["min_height"] = plant.height
 
-        def add_grow(self, owner: str):
+        def add_grow(self, owner: str, cm: int = 1):
             if owner in self.gardenstats:
-                count = self.gardenstats[owner]["plants_count"]
-                self.gardenstats[owner]["total_growth"] += count
+                stats = self.gardenstats[owner]
+                count = stats["plants_count"]
+                stats["total_growth"] += count * cm
+                stats["total_height"] += count * cm
+                if stats["min_height"] is not None:
+                    stats["min_height"] += cm
 
     def __init__(self):
-        self.gardens = {}
+        self._gardens = {}
+        self.stats = self.GardenStats()
+        self.pending_growth = {}
+
+    # bulk_grow only records growth per owner; reading gardens applies it
+    # first so plant heights seen through the public dict are never stale
+    @property
+    def gardens(self) -> dict:
+        if self.pending_growth:
+            self.settle()
+        return self._gardens
+
+    @gardens.setter
+    def gardens(self, gardens: dict) -> None:
+        # new plants, new aggregates: rebuild stats from the dict
+        self.pending_growth = {}
+        self._gardens = gardens
         self.stats = self.GardenStats()
+        for owner, plants in gardens.items():
+            self.stats.add_garden(owner)
+            for plant in plants:
+                self.stats.add_plant(owner, plant)
 
     def add_plant(self, owner: str, plant: Plant) -> None:
-        if owner not in self.gardens:
-            self.gardens[owner] = []
-        self.gardens[owner].append(plant)
+        if owner not in self._gardens:
+            self._gardens[owner] = []
+        self.settle(owner)
+        self._gardens[owner].append(plant)
         self.stats.add_plant(owner, plant)
         print(F"Added {plant.name} to {owner}'s garden")
 
@@ -83,21 +145,48 @@ class GardenManager:
         return network
 
     def help_grow(self, owner: str):
-        if owner not in self.gardens:
+        if owner not in self._gardens:
             print("There is no garden with this owner")
             return
         print(F"{owner}'s is helping all plants grow...")
-        for i in self.gardens[owner]:
+        self.settle(owner)
+        for i in self._gardens[owner]:
             i.grow()
         self.stats.add_grow(owner)
 
+    def bulk_grow(self, owner: str | None = None, cm: int = 1) -> None:
+        # deferred growth: only the per-owner stats and pending_growth are
+        # updated here. Plant heights catch up in settle(), which runs when
+        # gm.gardens, add_plant, help_grow or report touch the garden;
+        # plant objects held elsewhere stay stale until then.
+        if owner is not None and owner not in self._gardens:
+            print("There is no garden with this owner")
+            return
+        owners = list(self._gardens) if owner is None else [owner]
+        plants = 0
+        for name in owners:
+            self.pending_growth[name] = self.pending_growth.get(name, 0) + cm
+            self.stats.add_grow(name, cm)
+            plants += len(self._gardens[name])
+        print(F"Bulk growth: {plants} plants in {len(owners)} garden(s) "
+              F"grew {cm}cm")
+
+    def settle(self, owner: str | None = None) -> None:
+        owners = list(self.pending_growth) if owner is None else [owner]
+        for name in owners:
+            cm = self.pending_growth.pop(name, 0)
+            if cm:
+                for plant in self._gardens[name]:
+                    plant.height += cm
+
     def report(self, owner: str):
-        if owner not in self.gardens:
+        if owner not in self._gardens:
             print("There is no garden with this owner")
             return
+        self.settle(owner)
         print(F"=== {owner}'s Garden Report ===")
         print("Plants in garden:")
-        for plant in self.gardens[owner]:
+        for plant in self._gardens[owner]:
             print(F"- {plant}")
         print()
         print(F"Plant added: {self.stats.gardenstats[owner]["plants_count"]}, "
@@ -110,20 +199,17 @@ class GardenManager:
               F" {prize} prize flowers")
 
     def common_info(self):
-        for owner, garden in self.gardens.items():
-            for plant in garden:
-                if not self.validate_height(plant.height):
-                    print("Height validation test: False")
-                    return
+        # owners added straight through the gardens dict may have no stats
+        stats = {owner: self.stats.get(owner) for owner in self._gardens}
+        for owner in self._gardens:
+            min_height = stats[owner]["min_height"]
+            if min_height is not None and not self.validate_height(min_height):
+                print("Height validation test: False")
+                return
         print("Height validation test: True")
         print("Garden scores - ", end='')
-        score_parts = []
-        for owner, plants in self.gardens.items():
-            total_score = 0
-            for plant in plants:
-                if isinstance(plant, PrizeFlower):
-                    total_score += plant.points
-            score_parts.append(f"{owner}: {total_score}")
+        score_parts = [f"{owner}: {stats[owner]['prize_points']}"
+                       for owner in self._gardens]
         print(f"Garden scores - {', '.join(score_parts)}")
 
     @staticmethod
@@ -131,6 +217,286 @@ class GardenManager:
         return height > 0
 
 
+class GardenStore:
+    TABLES = """
+        CREATE TABLE IF NOT EXISTS gardens (
+            owner TEXT PRIMARY KEY,
+            total_growth INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS plants (
+            id INTEGER PRIMARY KEY,
+            owner TEXT NOT NULL,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            height INTEGER NOT NULL,
+            color TEXT,
+            status TEXT,
+            points INTEGER NOT NULL DEFAULT 0
+        );
+    """
+    INDEXES = {
+        "plants_owner": "plants (owner)",
+        "plants_type": "plants (type, owner, points)",
+        "plants_height": "plants (height)",
+    }
+    INSERT = ("INSERT INTO plants (owner, name, type, height, color, status, "
+              "points) VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+    def __init__(self, path: str = ":memory:"):
+        # autocommit mode so writes open an explicit BEGIN that also
+        # covers DROP/CREATE INDEX; `with self.db` then commits or rolls back
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute("PRAGMA synchronous = NORMAL")
+        self.db.executescript(self.TABLES)
+        self._create_indexes()
+
+    def _create_indexes(self) -> None:
+        for name, target in self.INDEXES.items():
+            self.db.execute(F"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+    def _drop_indexes(self) -> None:
+        for name in self.INDEXES:
+            self.db.execute(F"DROP INDEX IF EXISTS {name}")
+
+    @staticmethod
+    def row(owner: str, plant: Plant) -> tuple:
+        if isinstance(plant, PrizeFlower):
+            return (owner, plant.name, "prize", plant.height, plant.color,
+                    plant.status, plant.points)
+        if isinstance(plant, FloweringPlant):
+            return (owner, plant.name, "flowering", plant.height,
+                    plant.color, plant.status, 0)
+        return (owner, plant.name, "regular", plant.height, None, None, 0)
+
+    def _insert(self, rows: Iterable[tuple], bulk: bool) -> None:
+        # bulk loads rebuild the indexes once instead of per row
+        if bulk:
+            self._drop_indexes()
+        self.db.executemany(self.INSERT, rows)
+        if bulk:
+            self._create_indexes()
+
+    def insert_rows(self, rows: Iterable[tuple], bulk: bool = False) -> None:
+        with self.db:
+            self.db.execute("BEGIN")
+            self._insert(rows, bulk)
+
+    def save(self, manager: GardenManager) -> None:
+        manager.settle()
+        gardenstats = manager.stats.gardenstats
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.execute("DELETE FROM plants")
+            self.db.execute("DELETE FROM gardens")
+            self.db.executemany(
+                "INSERT INTO gardens VALUES (?, ?)",
+                ((owner, gardenstats.get(owner, {}).get("total_growth", 0))
+                 for owner in manager.gardens))
+            self._insert((self.row(owner, plant)
+                          for owner, plants in manager.gardens.items()
+                          for plant in plants), bulk=True)
+
+    def load(self, owner: str | None = None) -> GardenManager:
+        manager = GardenManager()
+        where, params = ("", ()) if owner is None else \
+            (" WHERE owner = ?", (owner,))
+        for name, total_growth in self.db.execute(
+                "SELECT owner, total_growth FROM gardens" + where, params):
+            manager.gardens[name] = []
+            manager.stats.add_garden(name)
+            manager.stats.gardenstats[name]["total_growth"] = total_growth
+        for name, p_name, p_type, height, color, status, points in \
+                self.db.execute("SELECT owner, name, type, height, color, "
+                                "status, points FROM plants" + where +
+                                " ORDER BY id", params):
+            if p_type == "prize":
+                plant = PrizeFlower(p_name, height, color, status, points)
+            elif p_type == "flowering":
+                plant = FloweringPlant(p_name, height, color, status)
+            else:
+                plant = Plant(p_name, height)
+            manager.gardens.setdefault(name, []).append(plant)
+            manager.stats.add_plant(name, plant)
+        return manager
+
+    def top_prize_gardens(self, k: int = 10) -> list[tuple[str, int]]:
+        return self.db.execute(
+            "SELECT owner, SUM(points) AS score FROM plants "
+            "WHERE type = 'prize' GROUP BY owner "
+            "ORDER BY score DESC LIMIT ?", (k,)).fetchall()
+
+    def plants_above(self, height: int, owner: str | None = None,
+                     limit: int = -1) -> list[tuple[str, str, int]]:
+        if owner is None:
+            return self.db.execute(
+                "SELECT owner, name, height FROM plants WHERE height > ? "
+                "LIMIT ?", (height, limit)).fetchall()
+        return self.db.execute(
+            "SELECT owner, name, height FROM plants "
+            "WHERE owner = ? AND height > ? LIMIT ?",
+            (owner, height, limit)).fetchall()
+
+    def count_above(self, height: int) -> int:
+        return self.db.execute(
+            "SELECT COUNT(*) FROM plants WHERE height > ?",
+            (height,)).fetchone()[0]
+
+    def close(self) -> None:
+        self.db.close()
+
+    def __enter__(self) -> "GardenStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def benchmark_store(plants: int = 1_000_000, owners: int = 10_000) -> None:
+    print(F"=== Garden Store Benchmark: {plants} plants, "
+          F"{owners} owners ===")
+    path = "benchmark_gardens.db"
+    if os.path.exists(path):
+        os.remove(path)
+    rows = ((F"owner_{i % owners}", "Sunflower", "prize", i % 500,
+             "yellow", "(Blooming)", i % 100) if i % 3 == 0 else
+            (F"owner_{i % owners}", "Oak Tree", "regular", i % 500,
+             None, None, 0) for i in range(plants))
+    try:
+        with GardenStore(path) as store:
+            start = time.perf_counter()
+            store.insert_rows(rows, bulk=True)
+            elapsed = time.perf_counter() - start
+            print(F"Bulk insert: {elapsed:.3f}s "
+                  F"({plants / elapsed / 1e6:.2f}M plants/s)")
+            queries = [
+                ("Top 10 prize gardens", store.top_prize_gardens, (10,)),
+                ("Count above 495cm", store.count_above, (495,)),
+                ("One owner above 400cm", store.plants_above,
+                 (400, "owner_42")),
+                ("First 100 above 490cm", store.plants_above,
+                 (490, None, 100)),
+                ("Load one owner", store.load, ("owner_42",)),
+            ]
+            for label, query, args in queries:
+                start = time.perf_counter()
+                query(*args)
+                print(F"{label}: "
+                      F"{(time.perf_counter() - start) * 1e3:.2f}ms")
+    finally:
+        os.remove(path)
+
+
+class _DictPlant:
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+def measure(factory, n: int) -> float:
+    tracemalloc.start()
+    plants = [factory(i) for i in range(n)]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del plants
+    return used / n
+
+
+def _fresh(text: str) -> str:
+    return "".join(list(text))
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    print(F"=== Plant Memory Benchmark: {n} instances per type ===")
+    cases = [
+        ("Plant",
+         lambda i: Plant("Oak", i),
+         lambda i: _DictPlant(name="Oak", height=i)),
+        ("FloweringPlant",
+         lambda i: FloweringPlant("Rose", i, _fresh("red"),
+                                  _fresh("(Blooming)")),
+         lambda i: _DictPlant(name="Rose", height=i, color=_fresh("red"),
+                              status=_fresh("(Blooming)"))),
+        ("PrizeFlower",
+         lambda i: PrizeFlower("Sunflower", i, _fresh("yellow"),
+                               _fresh("(Blooming)"), 10),
+         lambda i: _DictPlant(name="Sunflower", height=i,
+                              color=_fresh("yellow"),
+                              status=_fresh("(Blooming)"), points=10)),
+    ]
+    for name, compact, baseline in cases:
+        print(F"{name}: {measure(compact, n):.1f} bytes (slots) vs "
+              F"{measure(baseline, n):.1f} bytes (dict)")
+
+
+def benchmark_stats(owners: int = 10_000, plants: int = 1_000_000) -> None:
+    print(F"=== Garden Stats Benchmark: {owners} owners, "
+          F"{plants} plants ===")
+    gm = GardenManager()
+    start = time.perf_counter()
+    for i in range(plants):
+        owner = F"owner_{i % owners}"
+        if i % 3 == 0:
+            plant = PrizeFlower("Sunflower", 50, "yellow", "(Blooming)", 10)
+        elif i % 3 == 1:
+            plant = FloweringPlant("Rose", 25, "red", "(Blooming)")
+        else:
+            plant = Plant("Oak Tree", 100)
+        gm.gardens.setdefault(owner, []).append(plant)
+        gm.stats.add_plant(owner, plant)
+    print(F"Build with incremental stats: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    valid = all(gm.validate_height(plant.height)
+                for garden in gm.gardens.values() for plant in garden)
+    scores = {owner: sum(plant.points for plant in garden
+                         if isinstance(plant, PrizeFlower))
+              for owner, garden in gm.gardens.items()}
+    scan = time.perf_counter() - start
+    print(F"Full plant scan: {scan:.3f}s (valid={valid})")
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        gm.common_info()
+        incremental = time.perf_counter() - start
+    assert scores == {owner: stats["prize_points"]
+                      for owner, stats in gm.stats.gardenstats.items()}
+    print(F"Incremental common_info: {incremental * 1e3:.2f}ms")
+
+
+def benchmark_growth(plants: int = 1_000_000, rounds: int = 5) -> None:
+    print(F"=== Bulk Growth Benchmark: {plants}-plant garden ===")
+    gm = GardenManager()
+    garden = gm.gardens["Alice"] = []
+    for i in range(plants):
+        plant = Plant("Oak Tree", 100)
+        garden.append(plant)
+        gm.stats.add_plant("Alice", plant)
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            gm.help_grow("Alice")
+        per_plant = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(rounds):
+            gm.bulk_grow("Alice")
+        settle_start = time.perf_counter()
+        gm.settle()
+        bulk = time.perf_counter() - start
+        settle = time.perf_counter() - settle_start
+        start = time.perf_counter()
+        for _ in range(rounds):
+            gm.bulk_grow("Alice")
+            gm.settle()
+        per_round = time.perf_counter() - start
+    assert garden[0].height == 100 + 3 * rounds
+    assert gm.stats.gardenstats["Alice"]["total_growth"] == \
+        3 * rounds * plants
+    print(F"help_grow: {plants * rounds / per_plant / 1e6:.2f}M "
+          F"plant-growths/s")
+    print(F"bulk_grow + settle: {plants * rounds / bulk / 1e6:.2f}M "
+          F"plant-growths/s (settle: {settle:.3f}s of {bulk:.3f}s)")
+    print(F"bulk_grow settled every round: "
+          F"{plants * rounds / per_round / 1e6:.2f}M plant-growths/s")
+
+
 def main():
     print("=== Garden Management System Demo ===")
     gm = GardenManager.create_garden_network()
@@ -147,4 +513,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-stats":
+        benchmark_stats(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-growth":
+        benchmark_growth(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-store":
+        benchmark_store(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        main()
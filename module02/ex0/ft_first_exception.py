@@ -1,3 +1,15 @@
+import os
+import random
+import sys
+import time
+from array import array
+from collections import Counter
+from contextlib import redirect_stdout
+from itertools import compress, repeat
+from operator import is_
+from typing import Iterable
+
+TEMPERATURE_CLASSES = ("too_cold", "ok", "too_hot", "invalid")
 
 
 def check_temperature(temp_str: str) -> int | None:
@@ -18,6 +30,81 @@ def check_temperature(temp_str: str) -> int | None:
         return None
 
 
+def _temperature_class(reading: str | bytes) -> str:
+    # mirrors int(): surrounding whitespace, one sign, decimal digits with
+    # single underscores between them
+    text = reading.strip()
+    digits = text[1:] if text[:1] in ("+", "-", b"+", b"-") else text
+    if isinstance(digits, bytes):
+        parts = digits.split(b"_")
+        valid = all(part.isdigit() for part in parts)
+    else:
+        parts = digits.split("_")
+        valid = all(part.isdecimal() for part in parts)
+    # int() rejects strings over the max-digits limit with ValueError,
+    # so check_temperature reports them as invalid too
+    limit = sys.get_int_max_str_digits()
+    if not valid or limit and len(digits) - len(parts) + 1 > limit:
+        return "invalid"
+    temp = int(text)
+    if temp < 0:
+        return "too_cold"
+    return "ok" if temp <= 40 else "too_hot"
+
+
+def classify_temperatures(readings: Iterable[str | bytes] | bytes,
+                          indices: bool = False) -> dict:
+    # each distinct reading is classified once; sensor logs repeat values
+    if isinstance(readings, (bytes, bytearray, memoryview)):
+        readings = bytes(readings).splitlines()
+    elif indices and not isinstance(readings, list):
+        readings = list(readings)
+    seen = Counter(readings)
+    classes = {reading: _temperature_class(reading) for reading in seen}
+    counts = dict.fromkeys(TEMPERATURE_CLASSES, 0)
+    for reading, n in seen.items():
+        counts[classes[reading]] += n
+    report = {"total": sum(counts.values()), "counts": counts,
+              "indices": None}
+    if indices:
+        # class names are interned literals, so identity checks suffice
+        labels = list(map(classes.__getitem__, readings))
+        positions = range(len(labels))
+        report["indices"] = {
+            name: array("q", compress(positions,
+                                      map(is_, labels, repeat(name))))
+            for name in TEMPERATURE_CLASSES
+        }
+    return report
+
+
+def benchmark(n: int = 1_000_000) -> None:
+    print(f"=== Temperature Validation Benchmark: {n} readings ===")
+    junk = ["abc", "12.5", "", "--3", "1e3", "N/A"]
+    readings = [str(random.randint(-30, 70)) if random.random() < 0.98
+                else random.choice(junk) for _ in range(n)]
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        results = [check_temperature(reading) for reading in readings]
+        loop = time.perf_counter() - start
+    start = time.perf_counter()
+    report = classify_temperatures(readings)
+    bulk = time.perf_counter() - start
+    start = time.perf_counter()
+    classify_temperatures(readings, indices=True)
+    with_indices = time.perf_counter() - start
+    buffer = "\n".join(readings).encode()
+    start = time.perf_counter()
+    classify_temperatures(buffer)
+    from_buffer = time.perf_counter() - start
+    assert report["counts"]["ok"] == n - results.count(None)
+    print(f"check_temperature loop: {loop:.3f}s")
+    print(f"classify_temperatures: {bulk * 1e3:.1f}ms ({loop / bulk:.0f}x), "
+          f"with indices {with_indices * 1e3:.1f}ms, "
+          f"from bytes buffer {from_buffer * 1e3:.1f}ms")
+    print(f"Counts: {report['counts']}")
+
+
 def main() -> None:
     print("=== Garden Temperature Checker ===\n")
     check_temperature("25")
@@ -28,4 +115,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
@@ -1,3 +1,15 @@
+import heapq
+import os
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from itertools import compress
+from operator import attrgetter
+
+
 class GardenError(Exception):
     pass
 
@@ -10,6 +22,17 @@ class WaterError(GardenError):
     pass
 
 
+HEALTH_RULES = (
+    ("water_lvl", (1).__gt__, WaterError, "Water level", "too low (min 1)"),
+    ("water_lvl", (10).__lt__, WaterError, "Water level",
+     "too high (max 10)"),
+    ("sun_hours", (2).__gt__, PlantError, "Sunlight hours",
+     "too low (min 2)"),
+    ("sun_hours", (12).__lt__, PlantError, "Sunlight hours",
+     "too high (max 12)"),
+)
+
+
 class Plant:
     def __init__(self, name: str, sun_hours: int, water_lvl: int):
         self.name = name
@@ -41,6 +64,56 @@ class GardenManager:
         finally:
             print("Closing watering system (cleanup)")
 
+    def schedule_watering(self, ticks: int = 1, refill: int = 10,
+                          capacity: int | None = None, target: int = 10,
+                          dose: int = 1) -> dict:
+        # lowest water level first; each visit pours at most dose units and
+        # re-queues the plant until it reaches target, so the tank levels
+        # plants up evenly instead of filling them in list order
+        if dose < 1:
+            raise ValueError(f"dose must be at least 1, got {dose}")
+        if refill < 0:
+            raise ValueError(f"refill cannot be negative, got {refill}")
+        if capacity is not None and capacity < 0:
+            raise ValueError(f"capacity cannot be negative, got {capacity}")
+        plants = self.plants
+        if capacity is None:
+            capacity = max(self.water_tank, refill)
+        levels = array("q", map(attrgetter("water_lvl"), plants))
+        # heap keys pack (level, index) into one int for cheaper compares
+        shift = max(len(plants), 1).bit_length()
+        mask = (1 << shift) - 1
+        heap = [level << shift | i for i, level in enumerate(levels)
+                if level < target]
+        needy = [key & mask for key in heap]
+        heapq.heapify(heap)
+        tank = self.water_tank
+        waterings = tick = 0
+        while heap and tick < ticks:
+            if tick:
+                tank = min(capacity, tank + refill)
+            tick += 1
+            while heap and tank > 0:
+                level, i = heap[0] >> shift, heap[0] & mask
+                amount = min(target - level, dose, tank)
+                level += amount
+                tank -= amount
+                levels[i] = level
+                waterings += 1
+                if level < target:
+                    heapq.heapreplace(heap, level << shift | i)
+                else:
+                    heapq.heappop(heap)
+        watered = 0
+        for plant, level in zip(plants, levels):
+            if plant.water_lvl != level:
+                plant.water_lvl = level
+                watered += 1
+        self.water_tank = tank
+        return {"ticks": tick, "waterings": waterings, "watered": watered,
+                "thirsty": len(heap), "tank": tank,
+                "fairness": fairness([levels[i] for i in needy])}
+
     def check_health(self):
         for plant in self.plants:
             if plant.water_lvl < 1:
@@ -69,6 +142,129 @@ class GardenManager:
                     f"(water: {plant.water_lvl}, sun: {plant.sun_hours})"
                 )
 
+    def check_all(self) -> dict:
+        # one pass per rule over attribute columns; collects every violation
+        return _check_columns(*_columns(self.plants))
+
+
+def _columns(plants: list[Plant]) -> tuple[list[str], list[int], list[int]]:
+    return (list(map(attrgetter("name"), plants)),
+            list(map(attrgetter("water_lvl"), plants)),
+            list(map(attrgetter("sun_hours"), plants)))
+
+
+def _check_columns(names: list[str], water_lvl: list[int],
+                   sun_hours: list[int]) -> dict:
+    columns = {"water_lvl": water_lvl, "sun_hours": sun_hours}
+    errors: dict[type, list[GardenError]] = {
+        WaterError: [],
+        PlantError: [],
+    }
+    unhealthy = set()
+    for attr, failed, error, label, limit in HEALTH_RULES:
+        values = columns[attr]
+        for i in compress(range(len(names)), map(failed, values)):
+            unhealthy.add(i)
+            errors[error].append(error(
+                f"Error checking {names[i]}: "
+                f"{label} {values[i]} is {limit}"
+            ))
+    return {"checked": len(names),
+            "healthy": len(names) - len(unhealthy),
+            "errors": errors}
+
+
+def fairness(levels: list[int]) -> float:
+    # Jain's index: 1.0 when every plant ends at the same level
+    total = sum(levels)
+    squares = sum(level * level for level in levels)
+    return total * total / (len(levels) * squares) if squares else 1.0
+
+
+def check_gardens(gardens: list[GardenManager],
+                  workers: int | None = None) -> list[dict]:
+    # the check holds the GIL, so gardens go to worker processes; only the
+    # columns are pickled, not the Plant objects
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_check_columns, *zip(
+            *(_columns(garden.plants) for garden in gardens))))
+
+
+def benchmark(plants: int = 200_000, gardens: int = 8,
+              violations: int = 10) -> None:
+    print(f"=== Health Check Benchmark: {plants} plants, "
+          f"{violations} violations ===")
+    garden = GardenManager()
+    garden.plants = [Plant(f"plant_{i}", 6, 5) for i in range(plants)]
+    step = plants // violations
+    bad = garden.plants[step // 2::step][:violations]
+    for n, plant in enumerate(bad):
+        if n % 2:
+            plant.sun_hours = 20
+        else:
+            plant.water_lvl = 0
+    start = time.perf_counter()
+    report = garden.check_all()
+    engine = time.perf_counter() - start
+    found = sum(len(errors) for errors in report["errors"].values())
+    by_name = {plant.name: plant for plant in bad}
+    reruns = 0
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        start = time.perf_counter()
+        while True:
+            reruns += 1
+            try:
+                garden.check_health()
+                break
+            except GardenError as e:
+                name = str(e).split(":")[0].removeprefix("Error checking ")
+                by_name[name].water_lvl, by_name[name].sun_hours = 5, 6
+        loop = time.perf_counter() - start
+    print(f"Raise-on-first loop: {loop:.3f}s "
+          f"({reruns} runs to surface {violations} violations)")
+    print(f"check_all: {engine * 1e3:.1f}ms ({found} violations in one pass,"
+          f" {loop / engine:.0f}x)")
+    many = [GardenManager() for _ in range(gardens)]
+    for manager in many:
+        manager.plants = garden.plants
+    start = time.perf_counter()
+    for manager in many:
+        manager.check_all()
+    sequential = time.perf_counter() - start
+    start = time.perf_counter()
+    check_gardens(many)
+    pooled = time.perf_counter() - start
+    print(f"{gardens} gardens: sequential {sequential:.3f}s, "
+          f"check_gardens {pooled:.3f}s ({os.cpu_count()} CPUs)")
+
+
+def benchmark_watering(plants: int = 1_000_000, ticks: int = 4,
+                       refill: int = 500_000) -> None:
+    print(f"=== Watering Scheduler Benchmark: {plants} plants, "
+          f"{ticks} ticks of {refill} units ===")
+    start_levels = [random.randint(0, 9) for _ in range(plants)]
+    garden = GardenManager()
+    garden.plants = [Plant(f"plant_{i}", 6, level)
+                     for i, level in enumerate(start_levels)]
+    garden.water_tank = refill
+    start = time.perf_counter()
+    report = garden.schedule_watering(ticks, refill)
+    elapsed = time.perf_counter() - start
+    print(f"Priority scheduler: {elapsed:.3f}s, "
+          f"{report['waterings'] / elapsed / 1e6:.2f}M waterings/s, "
+          f"{report['watered'] / elapsed / 1e6:.2f}M plants watered/s")
+    print(f"Plants watered: {report['watered']}, "
+          f"still thirsty: {report['thirsty']}")
+    tank = refill * ticks
+    fifo = []
+    for level in start_levels:
+        if level < 10:
+            amount = min(10 - level, tank)
+            tank -= amount
+            fifo.append(level + amount)
+    print(f"Fairness (Jain): priority {report['fairness']:.3f}, "
+          f"list order {fairness(fifo):.3f}")
+
 
 def test_garden_management() -> None:
     garden = GardenManager()
@@ -108,5 +304,10 @@ def test_garden_management() -> None:
 
 
 if __name__ == "__main__":
-    print("=== Garden Management System ===")
-    test_garden_management()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:5]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-watering":
+        benchmark_watering(*(int(arg) for arg in sys.argv[2:5]))
+    else:
+        print("=== Garden Management System ===")
+        test_garden_management()
@@ -1,4 +1,133 @@
+import io
+import random
 import sys
+import time
+from array import array
+from collections import Counter
+from typing import BinaryIO, Iterable
+
+READ_SIZE = 1 << 22
+PERCENTILES = (25, 50, 75, 90, 99)
+
+
+def _extend_scores(scores: array | list, data: bytes) -> array | list:
+    # scores outside int64 don't fit the array; keep them in a plain list
+    start = len(scores)
+    try:
+        scores.extend(map(int, data.split()))
+    except OverflowError:
+        del scores[start:]
+        scores = scores.tolist()
+        scores.extend(map(int, data.split()))
+    return scores
+
+
+def parse_scores(stream: BinaryIO) -> array | list:
+    scores: array | list = array("q")
+    pending = b""
+    while True:
+        chunk = stream.read(READ_SIZE)
+        if not chunk:
+            break
+        data = pending + chunk
+        if data[-1:].isspace():
+            head, pending = data, b""
+        else:
+            parts = data.rsplit(None, 1)
+            if len(parts) == 1:
+                pending = data
+                continue
+            head, pending = parts
+        scores = _extend_scores(scores, head)
+    return _extend_scores(scores, pending)
+
+
+def score_stats(scores: Iterable[int], buckets: int = 10) -> dict:
+    counts = Counter(scores)
+    if not counts:
+        raise ValueError("no scores to analyse")
+    keys = sorted(counts)
+    count = total = 0
+    for key in keys:
+        count += counts[key]
+        total += key * counts[key]
+    low, high = keys[0], keys[-1]
+    targets = [(p, min(count - 1, p * count // 100)) for p in PERCENTILES]
+    percentiles = {}
+    buckets = min(buckets, high - low + 1)
+    width = -(-(high - low + 1) // buckets)
+    histogram = [[low + i * width, low + (i + 1) * width - 1, 0]
+                 for i in range(buckets)]
+    seen = 0
+    for key in keys:
+        seen += counts[key]
+        while targets and targets[0][1] < seen:
+            percentiles[targets.pop(0)[0]] = key
+        histogram[(key - low) // width][2] += counts[key]
+    return {
+        "count": count,
+        "total": total,
+        "average": total / count,
+        "high": high,
+        "low": low,
+        "range": high - low,
+        "percentiles": percentiles,
+        "histogram": [tuple(bucket) for bucket in histogram],
+    }
+
+
+def report(stats: dict) -> None:
+    print(F"Total players: {stats['count']}")
+    print(F"Total score: {stats['total']}")
+    print(F"Average score: {stats['average']}")
+    print(F"High score: {stats['high']}")
+    print(F"Low score: {stats['low']}")
+    print(F"Score range: {stats['range']}")
+    for p, value in stats["percentiles"].items():
+        print(F"P{p}: {value}")
+    print("Histogram:")
+    for start, end, count in stats["histogram"]:
+        print(F"  {start}-{end}: {count}")
+
+
+def stream_mode(path: str) -> None:
+    print("=== Player Score Analytics ===")
+    try:
+        if path == "-":
+            scores = parse_scores(sys.stdin.buffer)
+        else:
+            with open(path, "rb") as f:
+                scores = parse_scores(f)
+    except ValueError as e:
+        print(F"Caught ValueError: {e}")
+        return
+    except OSError as e:
+        print(F"Caught {type(e).__name__}: {e}")
+        return
+    if not scores:
+        print("No scores provided.")
+        return
+    report(score_stats(scores))
+
+
+def benchmark(n: int = 10_000_000) -> None:
+    print(F"=== Score Analytics Benchmark: {n} scores ===")
+    data = b" ".join(b"%d" % random.randint(0, 10000) for _ in range(n))
+    start = time.perf_counter()
+    scores = [int(x) for x in data.split()]
+    sum(scores), sum(scores) / len(scores)
+    max(scores), min(scores), max(scores) - min(scores)
+    print(F"List path (basic stats only): "
+          F"{time.perf_counter() - start:.3f}s, "
+          F"{sys.getsizeof(scores) + 28 * len(scores)} bytes")
+    start = time.perf_counter()
+    with io.BytesIO(data) as stream:
+        packed = parse_scores(stream)
+    stats = score_stats(packed)
+    print(F"Typed array path (with percentiles and histogram): "
+          F"{time.perf_counter() - start:.3f}s, "
+          F"{packed.buffer_info()[1] * packed.itemsize} bytes")
+    print(F"Median score: {stats['percentiles'][50]}")
 
 
 def main():
@@ -10,16 +139,24 @@ def main():
         return
     try:
         scores = [int(x) for x in sys.argv[1:]]
+        total = sum(scores)
+        high = max(scores)
+        low = min(scores)
         print(F"Scores processed: {scores}")
         print(F"Total players: {len(scores)}")
-        print(F"Total score: {sum(scores)}")
-        print(F"Average score: {sum(scores) / len(scores)}")
-        print(F"High score: {max(scores)}")
-        print(F"Low score: {min(scores)}")
-        print(F"Score range: {max(scores) - min(scores)}")
+        print(F"Total score: {total}")
+        print(F"Average score: {total / len(scores)}")
+        print(F"High score: {high}")
+        print(F"Low score: {low}")
+        print(F"Score range: {high - low}")
     except ValueError as e:
         print(F"Caught ValueError: {e}")
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "--file":
+        stream_mode(sys.argv[2])
+    elif len(sys.argv) in (2, 3) and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
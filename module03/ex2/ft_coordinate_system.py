@@ -1,4 +1,16 @@
+import heapq
+import io
 import math
+import random
+import sys
+import time
+from array import array
+from itertools import product, repeat
+from typing import BinaryIO, Hashable, Iterable, Iterator
+
+READ_SIZE = 1 << 22
+COMMA_ONLY = bytes(range(256)).translate(None, b",\n")
+INLINE_SPACE = b" \t\r\x0b\x0c"
 
 
 def distance(pos1: tuple, pos2: tuple) -> float:
@@ -7,6 +19,263 @@ def distance(pos1: tuple, pos2: tuple) -> float:
     return math.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
 
 
+def distances(origin: tuple, positions: Iterable[tuple]) -> list[float]:
+    return list(map(math.dist, repeat(origin), positions))
+
+
+def _parse_block(block: bytes, first_line: int, coords: array,
+                 errors: list[tuple[int, str]]) -> None:
+    lines = block.count(b"\n") + 1
+    shape = block.translate(None, COMMA_ONLY)
+    # fast path only when every line is exactly three non-empty fields
+    # with no inner whitespace; anything else goes through the per-line
+    # path so the bad line gets recorded
+    if shape == b",,\n" * (lines - 1) + b",," and \
+            not any(space in block for space in INLINE_SPACE):
+        tokens = block.replace(b",", b" ").split()
+        if len(tokens) == 3 * lines:
+            try:
+                coords.extend(array("d", map(float, tokens)))
+                return
+            except ValueError:
+                pass
+    if lines > 64:
+        middle = block.find(b"\n", len(block) // 2)
+        if middle == -1:
+            middle = block.rfind(b"\n")
+        head = block[:middle]
+        _parse_block(head, first_line, coords, errors)
+        _parse_block(block[middle + 1:], first_line + head.count(b"\n") + 1,
+                     coords, errors)
+        return
+    for number, line in enumerate(block.split(b"\n"), first_line):
+        if not line.strip():
+            continue
+        parts = line.split(b",")
+        try:
+            if len(parts) != 3:
+                raise ValueError
+            x, y, z = float(parts[0]), float(parts[1]), float(parts[2])
+        except ValueError:
+            errors.append((number, line.decode(errors="replace")))
+            continue
+        coords.extend((x, y, z))
+
+
+def parse_coordinates(source: bytes | BinaryIO
+                      ) -> tuple[array, list[tuple[int, str]]]:
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    coords = array("d")
+    errors: list[tuple[int, str]] = []
+    pending = b""
+    line = 1
+    while True:
+        chunk = source.read(READ_SIZE)
+        if not chunk:
+            break
+        data = pending + chunk
+        cut = data.rfind(b"\n")
+        if cut == -1:
+            pending = data
+            continue
+        pending = data[cut + 1:]
+        block = data[:cut]
+        _parse_block(block, line, coords, errors)
+        line += block.count(b"\n") + 1
+    if pending.strip():
+        _parse_block(pending, line, coords, errors)
+    return coords, errors
+
+
+def positions(coords: array) -> Iterator[tuple]:
+    values = iter(coords)
+    return zip(values, values, values)
+
+
+class SpatialGrid:
+    def __init__(self, cell_size: float = 10.0):
+        self.cell_size = cell_size
+        self.cells: dict[tuple, set] = {}
+        self.positions: dict[Hashable, tuple] = {}
+        self._low = [0, 0, 0]
+        self._high = [-1, -1, -1]
+
+    def _cell(self, pos: tuple) -> tuple:
+        size = self.cell_size
+        return (int(pos[0] // size), int(pos[1] // size),
+                int(pos[2] // size))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def insert(self, key: Hashable, pos: tuple) -> None:
+        if key in self.positions:
+            self.move(key, pos)
+            return
+        cell = self._cell(pos)
+        self.positions[key] = pos
+        self.cells.setdefault(cell, set()).add(key)
+        if len(self.positions) == 1:
+            self._low, self._high = list(cell), list(cell)
+        else:
+            for axis in range(3):
+                self._low[axis] = min(self._low[axis], cell[axis])
+                self._high[axis] = max(self._high[axis], cell[axis])
+
+    def insert_many(self, items: Iterable[tuple]) -> None:
+        for key, pos in items:
+            self.insert(key, pos)
+
+    def remove(self, key: Hashable) -> None:
+        cell = self._cell(self.positions.pop(key))
+        members = self.cells[cell]
+        members.discard(key)
+        if not members:
+            del self.cells[cell]
+
+    def move(self, key: Hashable, pos: tuple) -> None:
+        old = self.positions[key]
+        if self._cell(old) == self._cell(pos):
+            self.positions[key] = pos
+            return
+        self.remove(key)
+        self.insert(key, pos)
+
+    def within(self, center: tuple, radius: float) -> list:
+        low = self._cell(tuple(c - radius for c in center))
+        high = self._cell(tuple(c + radius for c in center))
+        # clamp the query cube to the occupied bounds, and scan the occupied
+        # cells directly when the cube still holds more cells than they do
+        spans = [range(max(low[i], self._low[i]),
+                       min(high[i], self._high[i]) + 1) for i in range(3)]
+        if math.prod(map(len, spans)) > len(self.cells):
+            cells = (members for cell, members in self.cells.items()
+                     if all(cell[i] in spans[i] for i in range(3)))
+        else:
+            cells = map(self.cells.get, product(*spans))
+        found = []
+        positions = self.positions
+        for members in cells:
+            if not members:
+                continue
+            for key in members:
+                if math.dist(center, positions[key]) <= radius:
+                    found.append(key)
+        return found
+
+    def _shell(self, origin: tuple, ring: int) -> list[tuple]:
+        # faces of the ring cube around origin, clamped to the occupied
+        # bounds, as (xs, ys, zs) ranges; each cell appears in one face
+        full = [range(max(origin[i] - ring, self._low[i]),
+                      min(origin[i] + ring, self._high[i]) + 1)
+                for i in range(3)]
+        inner = [range(max(origin[i] - ring + 1, self._low[i]),
+                       min(origin[i] + ring - 1, self._high[i]) + 1)
+                 for i in range(3)]
+        faces = []
+        for axis in range(3):
+            for side in sorted({origin[axis] - ring, origin[axis] + ring}):
+                if side in full[axis]:
+                    spans = inner[:axis] + [range(side, side + 1)] \
+                        + full[axis + 1:]
+                    faces.append(spans)
+        return faces
+
+    def nearest(self, center: tuple, k: int = 1) -> list[tuple]:
+        if k <= 0 or not self.positions:
+            return []
+        origin = self._cell(center)
+        # rings closer than the occupied bounds are empty; start at the box
+        ring = max(max(self._low[i] - origin[i], origin[i] - self._high[i], 0)
+                   for i in range(3))
+        max_ring = max(max(abs(origin[i] - self._low[i]),
+                           abs(origin[i] - self._high[i])) for i in range(3))
+        positions = self.positions
+        best: list[tuple] = []
+        while ring <= max_ring:
+            faces = self._shell(origin, ring)
+            if sum(math.prod(map(len, spans)) for spans in faces) \
+                    > len(self.cells):
+                return heapq.nsmallest(
+                    k, ((math.dist(center, pos), key)
+                        for key, pos in positions.items()))
+            for spans in faces:
+                for members in map(self.cells.get, product(*spans)):
+                    for key in members or ():
+                        d = math.dist(center, positions[key])
+                        if len(best) < k:
+                            heapq.heappush(best, (-d, key))
+                        elif d < -best[0][0]:
+                            heapq.heapreplace(best, (-d, key))
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+            ring += 1
+        return sorted((-d, key) for d, key in best)
+
+
+def benchmark(n: int = 1_000_000, queries: int = 100) -> None:
+    print(F"=== Spatial Index Benchmark: {n} positions ===")
+    world = 10_000.0
+    points = [(random.uniform(0, world), random.uniform(0, world),
+               random.uniform(0, world)) for _ in range(n)]
+    targets = points[:queries]
+    start = time.perf_counter()
+    grid = SpatialGrid(cell_size=world / round(n ** (1 / 3)))
+    grid.insert_many(enumerate(points))
+    print(F"Grid build: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    for target in targets:
+        min(range(n), key=lambda i: distance(target, points[i]))
+    brute = time.perf_counter() - start
+    print(F"Brute force distance(): {brute / queries * 1e3:.2f}ms per query")
+    start = time.perf_counter()
+    for target in targets:
+        min(distances(target, points))
+    batched = time.perf_counter() - start
+    print(F"Batched math.dist: {batched / queries * 1e3:.2f}ms per query")
+    start = time.perf_counter()
+    for target in targets:
+        grid.nearest(target, 5)
+    elapsed = time.perf_counter() - start
+    print(F"Grid 5-nearest: {elapsed / queries * 1e3:.3f}ms per query")
+    start = time.perf_counter()
+    for target in targets:
+        grid.within(target, 200.0)
+    elapsed = time.perf_counter() - start
+    print(F"Grid radius 200: {elapsed / queries * 1e3:.3f}ms per query")
+    start = time.perf_counter()
+    for i in range(queries * 100):
+        x, y, z = points[i]
+        grid.move(i, (x + 1.0, y + 1.0, z + 1.0))
+    elapsed = time.perf_counter() - start
+    print(F"Position update: {elapsed / (queries * 100) * 1e6:.2f}us")
+
+
+def benchmark_parser(n: int = 10_000_000) -> None:
+    print(F"=== Coordinate Parser Benchmark: {n} rows ===")
+    rows = [b"%d,%d,%d" % (i % 1000, i % 777, i % 555) for i in range(n)]
+    rows[n // 2] = b"abc,def,ghi"
+    data = b"\n".join(rows)
+    text = data.decode().split("\n")
+    start = time.perf_counter()
+    parsed = []
+    for row in text:
+        try:
+            parsed.append(tuple([int(x) for x in row.split(",")]))
+        except ValueError:
+            pass
+    print(F"Per-string path: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    coords, errors = parse_coordinates(data)
+    print(F"Bulk parser: {time.perf_counter() - start:.3f}s "
+          F"({len(coords) // 3} rows, {len(errors)} invalid)")
+    start = time.perf_counter()
+    farthest = max(distances((0, 0, 0), positions(coords)))
+    print(F"Distances from origin: {time.perf_counter() - start:.3f}s "
+          F"(max {farthest:.1f})")
+
+
 def unpacking(player: tuple, coordinates: tuple) -> None:
     print("Unpacking demonstration:")
     x1, y1, z1 = player
@@ -46,4 +315,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-parser":
+        benchmark_parser(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
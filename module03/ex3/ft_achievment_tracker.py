@@ -1,3 +1,9 @@
+import random
+import sys
+import time
+from typing import Iterable
+
+
 # def main():
 #     print("=== Achievement Tracker System ===\n")
 
@@ -36,6 +42,120 @@
 # if __name__ == "__main__":
 #     main()
 
+class AchievementIndex:
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.counts: list[int] = []
+        self.players: dict[str, int] = {}
+
+    def achievement_id(self, name: str) -> int:
+        if name not in self.ids:
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.counts.append(0)
+        return self.ids[name]
+
+    def encode(self, achievements: Iterable[str]) -> int:
+        bits = 0
+        for name in achievements:
+            bits |= 1 << self.achievement_id(name)
+        return bits
+
+    def decode(self, bits: int) -> set[str]:
+        names = set()
+        while bits:
+            low = bits & -bits
+            names.add(self.names[low.bit_length() - 1])
+            bits ^= low
+        return names
+
+    def add_player(self, player: str, achievements: Iterable[str]) -> None:
+        old = self.players.get(player, 0)
+        bits = old | self.encode(achievements)
+        new = bits & ~old
+        while new:
+            low = new & -new
+            self.counts[low.bit_length() - 1] += 1
+            new ^= low
+        self.players[player] = bits
+
+    def holders(self, achievement: str) -> int:
+        return self.counts[self.ids[achievement]]
+
+    def rarity(self) -> dict[str, float]:
+        total = len(self.players) or 1
+        return {name: self.counts[i] / total
+                for i, name in enumerate(self.names)}
+
+    def rare(self, max_holders: int = 1) -> set[str]:
+        return {self.names[i] for i, count in enumerate(self.counts)
+                if 0 < count <= max_holders}
+
+    def all_unique(self) -> set[str]:
+        return {self.names[i] for i, count in enumerate(self.counts)
+                if count}
+
+    def common(self, players: Iterable[str] | None = None) -> set[str]:
+        if players is None:
+            total = len(self.players)
+            return {self.names[i] for i, count in enumerate(self.counts)
+                    if total and count == total}
+        bits = -1
+        for player in players:
+            bits &= self.players[player]
+        return self.decode(bits) if bits != -1 else set()
+
+    def unique(self, player: str, other: str) -> set[str]:
+        return self.decode(self.players[player] & ~self.players[other])
+
+    def jaccard(self, a: str, b: str) -> float:
+        bits_a, bits_b = self.players[a], self.players[b]
+        union = (bits_a | bits_b).bit_count()
+        return (bits_a & bits_b).bit_count() / union if union else 1.0
+
+    def most_similar(self, player: str, top: int = 5) -> list[tuple]:
+        bits = self.players[player]
+        scores = []
+        for other, other_bits in self.players.items():
+            if other == player:
+                continue
+            union = (bits | other_bits).bit_count()
+            if union:
+                scores.append(((bits & other_bits).bit_count() / union,
+                               other))
+        scores.sort(reverse=True)
+        return [(other, score) for score, other in scores[:top]]
+
+
+def benchmark(players: int = 300_000, achievements: int = 200) -> None:
+    print(f"=== Achievement Analytics Benchmark: {players} players ===")
+    catalog = [f"achievement_{i}" for i in range(achievements)]
+    weights = [1 / (i + 1) for i in range(achievements)]
+    data = {f"player_{p}": set(random.choices(catalog, weights, k=8))
+            for p in range(players)}
+    start = time.perf_counter()
+    index = AchievementIndex()
+    for player, owned in data.items():
+        index.add_player(player, owned)
+    print(f"Index build: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    rare = index.rare()
+    common = index.common()
+    print(f"Rare/common via counts: {(time.perf_counter() - start) * 1e3:.2f}"
+          f"ms ({len(rare)} rare, {len(common)} common)")
+    start = time.perf_counter()
+    index.most_similar("player_0")
+    print(f"Jaccard scan over all players: "
+          f"{time.perf_counter() - start:.3f}s")
+    sample = list(data.values())[:2000]
+    start = time.perf_counter()
+    set().union(*(s - set().union(*(o for o in sample if o is not s))
+                  for s in sample))
+    print(f"Set-difference rare over {len(sample)} players: "
+          f"{time.perf_counter() - start:.3f}s")
+
+
 def main():
     print("=== Achievement Tracker System ===\n")
 
@@ -58,32 +178,31 @@ def main():
 
     print("=== Achievement Analytics ===")
 
-    alice = players["Alice"]
-    bob = players["Bob"]
-    charlie = players["Charlie"]
+    index = AchievementIndex()
+    for name, achievements in players.items():
+        index.add_player(name, achievements)
 
-    all_unique = set.union(alice, bob, charlie)
+    all_unique = index.all_unique()
     print(f"All unique achievements: {all_unique}")
     print(f"Total unique achievements: {len(all_unique)}\n")
 
-    common_all = set.intersection(alice, bob, charlie)
+    common_all = index.common()
     print(f"Common to all players: {common_all}")
 
-    rare = (
-        (alice - bob - charlie) |
-        (bob - alice - charlie) |
-        (charlie - alice - bob)
-    )
+    rare = index.rare()
 
     print(f"Rare achievements (1 player): {rare}\n")
 
-    print(f"Alice vs Bob common: {alice & bob}")
-    print(f"Alice unique: {alice - bob}")
-    print(f"Bob unique: {bob - alice}")
+    print(f"Alice vs Bob common: {index.common(['Alice', 'Bob'])}")
+    print(f"Alice unique: {index.unique('Alice', 'Bob')}")
+    print(f"Bob unique: {index.unique('Bob', 'Alice')}")
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        main()
 
 # & - intersection, common for both
 # | - union
@@ -1,4 +1,133 @@
+import heapq
+import os
+import random
 import sys
+import time
+from operator import itemgetter
+from typing import BinaryIO, Iterable
+
+READ_SIZE = 1 << 22
+
+
+class InventoryEngine:
+    def __init__(self, moderate_threshold: int = 5):
+        self.totals: dict[str, int] = {}
+        self.records = 0
+        self.invalid = 0
+        self.moderate_threshold = moderate_threshold
+
+    def add_records(self, records: Iterable[str]) -> None:
+        totals = self.totals
+        get = totals.get
+        count = invalid = 0
+        for record in records:
+            item, sep, qty = record.partition(":")
+            try:
+                if not sep or not item:
+                    raise ValueError
+                totals[item] = get(item, 0) + int(qty)
+                count += 1
+            except ValueError:
+                invalid += 1
+        self.records += count
+        self.invalid += invalid
+
+    def ingest(self, stream: BinaryIO) -> None:
+        pending = b""
+        while True:
+            chunk = stream.read(READ_SIZE)
+            if not chunk:
+                break
+            data = pending + chunk
+            if data[-1:].isspace():
+                head, pending = data, b""
+            else:
+                parts = data.rsplit(None, 1)
+                if len(parts) == 1:
+                    pending = data
+                    continue
+                head, pending = parts
+            self.add_records(self._decode(head))
+        self.add_records(self._decode(pending))
+
+    def _decode(self, data: bytes) -> list[str]:
+        try:
+            return data.decode().split()
+        except UnicodeDecodeError:
+            pass
+        # a bad byte only invalidates the record that contains it
+        records: list[str] = []
+        for raw in data.split():
+            try:
+                records.extend(raw.decode().split())
+            except UnicodeDecodeError:
+                self.invalid += 1
+        return records
+
+    def total(self) -> int:
+        return sum(self.totals.values())
+
+    def most_abundant(self, k: int = 1) -> list[tuple[str, int]]:
+        return heapq.nlargest(k, self.totals.items(), key=itemgetter(1))
+
+    def least_abundant(self, k: int = 1) -> list[tuple[str, int]]:
+        return heapq.nsmallest(k, self.totals.items(), key=itemgetter(1))
+
+    def category(self, name: str) -> Iterable[tuple[str, int]]:
+        threshold = self.moderate_threshold
+        if name == "moderate":
+            return ((i, q) for i, q in self.totals.items() if q >= threshold)
+        if name == "scarce":
+            return ((i, q) for i, q in self.totals.items() if q < threshold)
+        if name == "restock":
+            return ((i, q) for i, q in self.totals.items() if q == 1)
+        raise ValueError(f"Unknown category: {name}")
+
+
+def stream_mode(path: str) -> None:
+    print("=== Inventory System Analysis ===")
+    engine = InventoryEngine()
+    try:
+        if path == "-":
+            engine.ingest(sys.stdin.buffer)
+        else:
+            with open(path, "rb") as f:
+                engine.ingest(f)
+    except OSError as e:
+        print(F"Caught {type(e).__name__}: {e}")
+        return
+    print(F"Records: {engine.records}, invalid: {engine.invalid}")
+    print(F"Total items in inventory: {engine.total()}")
+    print(F"Unique item types: {len(engine.totals)}")
+    print(F"Most abundant: {engine.most_abundant(5)}")
+    print(F"Least abundant: {engine.least_abundant(5)}")
+
+
+def benchmark(records: int = 20_000_000, items: int = 10_000) -> None:
+    print(f"=== Inventory Engine Benchmark: {records} records ===")
+    path = "benchmark_inventory.txt"
+    names = [f"item{i}" for i in range(items)]
+    with open(path, "w") as f:
+        for _ in range(records // 100_000):
+            f.write("\n".join(f"{random.choice(names)}:{random.randint(1, 9)}"
+                              for _ in range(100_000)))
+            f.write("\n")
+    try:
+        engine = InventoryEngine()
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            engine.ingest(f)
+        elapsed = time.perf_counter() - start
+        print(f"Ingest: {elapsed:.3f}s "
+              f"({engine.records / elapsed / 1e6:.2f}M records/s, "
+              f"{len(engine.totals)} distinct items)")
+        start = time.perf_counter()
+        engine.most_abundant(5)
+        engine.least_abundant(5)
+        sum(1 for _ in engine.category("restock"))
+        print(f"Queries: {(time.perf_counter() - start) * 1e3:.2f}ms")
+    finally:
+        os.remove(path)
 
 
 def main():
@@ -6,9 +135,13 @@ def main():
     if (len(sys.argv) == 1):
         print("No arguments provided")
         return
-    inventory = {item.split(":")[0]: int(item.split(":")[1])
-                 for item in sys.argv[1:]}
-    total = sum(inventory.values())
+    engine = InventoryEngine()
+    engine.add_records(sys.argv[1:])
+    inventory = engine.totals
+    if not inventory:
+        print("No valid item:quantity arguments provided")
+        return
+    total = engine.total()
     print(F"Total items in inventory: {total}")
     print(F"Unique item types: {len(inventory)}\n")
 
@@ -19,37 +152,17 @@ def main():
         print(f"{item}: {qty} {unit} ({percent}%)")
 
     print("\n=== Inventory Statistics ===")
-    most_item = None
-    least_item = None
-    most_qty = -1
-    least_qty = float("inf")
-    for item, qty in inventory.items():
-        if qty > most_qty:
-            most_qty = qty
-            most_item = item
-        if qty < least_qty:
-            least_qty = qty
-            least_item = item
+    most_item, most_qty = engine.most_abundant()[0]
+    least_item, least_qty = engine.least_abundant()[0]
     print(f"Most abundant: {most_item} ({most_qty} units)")
     print(f"Least abundant: {least_item} ({least_qty} unit)")
 
     print("\n=== Item Categories ===")
-    moderate = {}
-    scarce = {}
-
-    for item, qty in inventory.items():
-        if qty >= 5:
-            moderate[item] = qty
-        else:
-            scarce[item] = qty
-    print("Moderate:", moderate)
-    print("Scarce:", scarce)
+    print("Moderate:", dict(engine.category("moderate")))
+    print("Scarce:", dict(engine.category("scarce")))
 
     print("\n=== Management Suggestions ===")
-    restock = []
-    for k, v in inventory.items():
-        if v == 1:
-            restock.append(k)
+    restock = [item for item, _ in engine.category("restock")]
     print(F"Restock needed: {restock}")
 
     print("\n=== Dictionary Properties Demo ===")
@@ -59,4 +172,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == "--file":
+        stream_mode(sys.argv[2])
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        main()
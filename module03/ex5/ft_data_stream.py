@@ -1,19 +1,74 @@
+import math
 import random
+import sys
 import time
+from collections import deque
+from functools import lru_cache
+from itertools import compress, islice
 from typing import Generator
 
+PLAYERS = ['alice', 'bob', 'charlie']
+ACTIONS = ['killed monster', 'found treasure', 'leveled up']
+LEVELS = range(1, 21)
+BATCH_SIZE = 1 << 16
 
-def game_events(num_events: int) -> Generator[str, None, None]:
-    players = ['alice', 'bob', 'charlie']
-    actions = ['killed monster', 'found treasure', 'leveled up']
 
+def game_events(num_events: int) -> Generator[str, None, None]:
     for i in range(1, num_events + 1):
-        player = random.choice(players)
-        action = random.choice(actions)
+        player = random.choice(PLAYERS)
+        action = random.choice(ACTIONS)
         level = random.randint(1, 20)
         yield f"Event {i}: Player {player} (level {level}) {action}"
 
 
+class EventBatch:
+    def __init__(self, first_id: int, players: bytes, actions: bytes,
+                 levels: bytes):
+        self.first_id = first_id
+        self.players = players
+        self.actions = actions
+        self.levels = levels
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def high_level(self, threshold: int = 10) -> int:
+        return sum(self.levels.count(lvl) for lvl in LEVELS
+                   if lvl >= threshold)
+
+    def action_count(self, action: str) -> int:
+        return self.actions.count(ACTIONS.index(action))
+
+    def event(self, i: int) -> str:
+        return (f"Event {self.first_id + i}: "
+                f"Player {PLAYERS[self.players[i]]} "
+                f"(level {self.levels[i]}) {ACTIONS[self.actions[i]]}")
+
+    def events(self) -> Generator[str, None, None]:
+        for i in range(len(self)):
+            yield self.event(i)
+
+
+def _random_codes(k: int, n: int, offset: int = 0) -> bytes:
+    limit = 256 - 256 % n
+    rejected = bytes(range(limit, 256))
+    table = bytes(offset + b % n for b in range(256))
+    codes = b""
+    while len(codes) < k:
+        codes += random.randbytes(k + k // 8).translate(None, rejected)
+    return codes[:k].translate(table)
+
+
+def game_event_batches(num_events: int, batch_size: int = BATCH_SIZE
+                       ) -> Generator[EventBatch, None, None]:
+    for first in range(1, num_events + 1, batch_size):
+        k = min(batch_size, num_events + 1 - first)
+        yield EventBatch(first,
+                         _random_codes(k, len(PLAYERS)),
+                         _random_codes(k, len(ACTIONS)),
+                         _random_codes(k, len(LEVELS), LEVELS.start))
+
+
 def fibonacci(n: int) -> Generator[int, None, None]:
     a, b = 0, 1
     for _ in range(n):
@@ -21,24 +76,189 @@ def fibonacci(n: int) -> Generator[int, None, None]:
         a, b = b, a + b
 
 
+def _fib_pair(k: int, mod: int = 0) -> tuple[int, int]:
+    a, b = 0, 1
+    for bit in bin(k)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if mod:
+            c, d = c % mod, d % mod
+        if bit == "1":
+            a, b = d, c + d
+            if mod:
+                b %= mod
+        else:
+            a, b = c, d
+    return a, b
+
+
+@lru_cache(maxsize=128)
+def fib(k: int) -> int:
+    if k < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    return _fib_pair(k)[0]
+
+
+def fib_mod(k: int, m: int) -> int:
+    if k < 0 or m < 1:
+        raise ValueError("Fibonacci index must be >= 0 and modulus >= 1")
+    return _fib_pair(k, m)[0] % m
+
+
+def fibonacci_from(start: int, count: int | None = None
+                   ) -> Generator[int, None, None]:
+    # validated here so a bad start fails at the call, not on first next()
+    if start < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    return _fibonacci_from(start, count)
+
+
+def _fibonacci_from(start: int, count: int | None
+                    ) -> Generator[int, None, None]:
+    a, b = _fib_pair(start)
+    produced = 0
+    while count is None or produced < count:
+        yield a
+        a, b = b, a + b
+        produced += 1
+
+
+def benchmark_fibonacci(k: int = 1_000_000) -> None:
+    print(f"=== Fibonacci Benchmark: F({k}) ===")
+    start = time.perf_counter()
+    value = deque(fibonacci(k + 1), maxlen=1)[0]
+    print(f"Sequential generator: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    assert _fib_pair(k)[0] == value
+    print(f"Fast doubling fib(k): {time.perf_counter() - start:.3f}s "
+          f"({value.bit_length()} bits)")
+    start = time.perf_counter()
+    fib_mod(10 ** 18, 1_000_000_007)
+    print(f"fib_mod(10^18, 1e9+7): "
+          f"{(time.perf_counter() - start) * 1e6:.1f}us")
+    start = time.perf_counter()
+    deque(fibonacci_from(k, 1000), maxlen=0)
+    print(f"Range F({k})..F({k + 999}) via fibonacci_from: "
+          f"{time.perf_counter() - start:.3f}s")
+
+
+SEGMENT_SIZE = 1 << 18
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
 def is_prime(num: int) -> bool:
     if num < 2:
         return False
-    for i in range(2, int(num**0.5)+1):
-        if num % i == 0:
+    for p in SMALL_PRIMES:
+        if num % p == 0:
+            return num == p
+    d, s = num - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in SMALL_PRIMES:
+        x = pow(a, d, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
             return False
     return True
 
 
+def _simple_sieve(limit: int) -> list[int]:
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[:2] = b"\x00\x00"
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit + 1, p)))
+    return list(compress(range(limit + 1), sieve))
+
+
+def prime_stream(segment_size: int = SEGMENT_SIZE
+                 ) -> Generator[int, None, None]:
+    base_limit = 1 << 10
+    base = _simple_sieve(base_limit)
+    low = 0
+    while True:
+        high = low + segment_size
+        if base_limit * base_limit < high:
+            base_limit = max(base_limit * 2, math.isqrt(high) + 1)
+            base = _simple_sieve(base_limit)
+        segment = bytearray([1]) * segment_size
+        if low == 0:
+            segment[:2] = b"\x00\x00"
+        for p in base:
+            square = p * p
+            if square >= high:
+                break
+            start = max(square, -(-low // p) * p) - low
+            segment[start::p] = bytes(len(range(start, segment_size, p)))
+        yield from compress(range(low, high), segment)
+        low = high
+
+
 def primes(n: int) -> Generator[int, None, None]:
+    yield from islice(prime_stream(), n)
+
+
+def _trial_primes(n: int) -> Generator[int, None, None]:
     count, candidate = 0, 2
     while count < n:
-        if is_prime(candidate):
+        if all(candidate % i for i in range(2, math.isqrt(candidate) + 1)):
             yield candidate
             count += 1
         candidate += 1
 
 
+def benchmark_primes(n: int = 1_000_000) -> None:
+    print(f"=== Prime Stream Benchmark: first {n} primes ===")
+    start = time.perf_counter()
+    last = deque(primes(n), maxlen=1)
+    print(f"Segmented sieve: {time.perf_counter() - start:.3f}s "
+          f"(last prime {last[0]})")
+    sample = min(n, 100_000)
+    start = time.perf_counter()
+    deque(_trial_primes(sample), maxlen=0)
+    elapsed = time.perf_counter() - start
+    print(f"Trial division: {elapsed:.3f}s for {sample} primes")
+    big = (1 << 61) - 1
+    start = time.perf_counter()
+    for k in range(1000):
+        is_prime(big + 2 * k)
+    print(f"Miller-Rabin is_prime near 2^61: "
+          f"{(time.perf_counter() - start) * 1e3:.3f}us per call")
+
+
+def benchmark_events(num_events: int = 10_000_000) -> None:
+    print(f"=== Event Stream Benchmark: {num_events} events ===")
+    start = time.perf_counter()
+    high_level = treasure_events = level_up_events = 0
+    for event in game_events(num_events):
+        level = int(event.split('level ')[1].split(')')[0])
+        if level >= 10:
+            high_level += 1
+        if 'found treasure' in event:
+            treasure_events += 1
+        if 'leveled up' in event:
+            level_up_events += 1
+    print(f"String events: {time.perf_counter() - start:.3f}s "
+          f"({high_level} high-level, {treasure_events} treasure, "
+          f"{level_up_events} level-up)")
+    start = time.perf_counter()
+    high_level = treasure_events = level_up_events = 0
+    for batch in game_event_batches(num_events):
+        high_level += batch.high_level()
+        treasure_events += batch.action_count('found treasure')
+        level_up_events += batch.action_count('leveled up')
+    print(f"Batched events: {time.perf_counter() - start:.3f}s "
+          f"({high_level} high-level, {treasure_events} treasure, "
+          f"{level_up_events} level-up)")
+
+
 def main():
     print("=== Game Data Stream Processor ===")
     num_events = 1000
@@ -79,4 +299,11 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench-events":
+        benchmark_events(*(int(arg) for arg in sys.argv[2:3]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-primes":
+        benchmark_primes(*(int(arg) for arg in sys.argv[2:3]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench-fib":
+        benchmark_fibonacci(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
@@ -1,3 +1,142 @@
+import heapq
+import random
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from itertools import compress, repeat
+from typing import Any, Callable, Iterable
+
+
+class ColumnTable:
+    def __init__(self, columns: dict[str, str | None], key: str):
+        self.columns: dict[str, Any] = {
+            name: array(code) if code else []
+            for name, code in columns.items()
+        }
+        self.key = key
+        self.index: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns[self.key])
+
+    def append(self, **row: Any) -> int:
+        row_id = len(self)
+        self.index[row[self.key]] = row_id
+        for name, column in self.columns.items():
+            column.append(row[name])
+        return row_id
+
+    def extend(self, **columns: Iterable) -> None:
+        first = len(self)
+        for name, values in columns.items():
+            self.columns[name].extend(values)
+        keys = self.columns[self.key]
+        self.index.update(zip(keys[first:], range(first, len(self))))
+
+    def column(self, name: str) -> Any:
+        return self.columns[name]
+
+    def row(self, key: Any) -> dict[str, Any]:
+        row_id = self.index[key]
+        return {name: column[row_id] for name, column in self.columns.items()}
+
+    def filter(self, name: str, predicate: Callable[[Any], bool]
+               ) -> list[int]:
+        return list(compress(range(len(self)),
+                             map(predicate, self.columns[name])))
+
+    def take(self, name: str, rows: Iterable[int]) -> list:
+        column = self.columns[name]
+        return [column[i] for i in rows]
+
+    def top_k(self, name: str, k: int) -> list[int]:
+        column = self.columns[name]
+        return heapq.nlargest(k, range(len(self)), key=column.__getitem__)
+
+    def bucket_counts(self, name: str, edges: list[float]) -> list[int]:
+        # bucket i holds values v with edges[i - 1] <= v < edges[i]
+        counts = [0] * (len(edges) + 1)
+        for bucket in map(bisect_right, repeat(edges),
+                          self.columns[name]):
+            counts[bucket] += 1
+        return counts
+
+    def group_by(self, key: str, value: str,
+                 reducer: Callable[[Any, Any], Any] = lambda a, b: a + b
+                 ) -> dict[Any, Any]:
+        groups: dict[Any, Any] = {}
+        get = groups.get
+        for k, v in zip(self.columns[key], self.columns[value]):
+            current = get(k)
+            groups[k] = v if current is None else reducer(current, v)
+        return groups
+
+
+def build_table(players: list[str], scores: list[int], regions: list[str],
+                achievements: dict[str, list[str]]) -> ColumnTable:
+    table = ColumnTable({"player": None, "score": "q", "region": None,
+                         "achievements": "l"}, key="player")
+    table.extend(player=players, score=scores, region=regions,
+                 achievements=[len(achievements.get(p, ()))
+                               for p in players])
+    return table
+
+
+def dashboard(table: ColumnTable,
+              achievements: dict[str, list[str]]) -> dict[str, Any]:
+    players = table.column("player")
+    scores = table.column("score")
+    counts = table.column("achievements")
+    # score buckets: low < 1500 <= medium <= 2000 < high; edges are the
+    # inclusive lower bounds of medium and high
+    low, medium, high = table.bucket_counts("score", [1500, 2001])
+    top = table.top_k("score", 1)[0]
+    return {
+        "high_scorers": table.take("player",
+                                   table.filter("score", (2000).__lt__)),
+        "scores_doubled": [score * 2 for score in scores],
+        "active_players": table.take("player",
+                                     table.filter("achievements",
+                                                  (2).__lt__)),
+        "score_categories": {"high": high, "medium": medium, "low": low},
+        "achievement_counts": dict(zip(players, counts)),
+        "unique_players": set(players),
+        "unique_achievements": {ach for ach_list in achievements.values()
+                                for ach in ach_list},
+        "active_regions": set(table.column("region")),
+        "average_score": sum(scores) / len(scores),
+        "top_performer": players[top],
+        "top_score": scores[top],
+        "top_achievements": counts[top],
+    }
+
+
+def benchmark(n: int = 2_000_000) -> None:
+    print(f"=== Dashboard Benchmark: {n} players ===")
+    players = [f"player_{i}" for i in range(n)]
+    scores = [random.randint(500, 3000) for _ in range(n)]
+    regions = random.choices(["north", "east", "central", "south"], k=n)
+    achievements = {p: ["first_kill"] * random.randint(0, 6)
+                    for p in players}
+    start = time.perf_counter()
+    table = build_table(players, scores, regions, achievements)
+    print(f"Table build: {time.perf_counter() - start:.3f}s")
+    edge_cases = build_table(["a", "b", "c", "d"], [1499, 1500, 2000, 2001],
+                             ["north"] * 4, {})
+    assert dashboard(edge_cases, {})["score_categories"] == \
+        {"high": 1, "medium": 2, "low": 1}
+    start = time.perf_counter()
+    result = dashboard(table, achievements)
+    print(f"Dashboard computation: {time.perf_counter() - start:.3f}s")
+    start = time.perf_counter()
+    table.group_by("region", "score")
+    print(f"Group-by region total score: "
+          f"{time.perf_counter() - start:.3f}s")
+    print(f"Top performer: {result['top_performer']} "
+          f"({result['top_score']} points)")
+
+
 def main():
     players = ['alice', 'bob', 'charlie', 'diana']
     scores = [2300, 1800, 2150, 2050]
@@ -12,65 +151,45 @@ def main():
     }
     regions = ['north', 'east', 'central', 'north']
 
-    print("=== Game Analytics Dashboard ===\n")
+    table = build_table(players, scores, regions, achievements)
+    result = dashboard(table, achievements)
 
-    high_scorers = [players[i] for i, score in enumerate(scores)
-                    if score > 2000]
-    scores_doubled = [score * 2 for score in scores]
-    active_players = [player for player,
-                      ach in achievements.items()
-                      if len(ach) > 2]
+    print("=== Game Analytics Dashboard ===\n")
 
     print("=== List Comprehension Examples ===")
-    print("High scorers (>2000):", high_scorers)
-    print("Scores doubled:", scores_doubled)
-    print("Active players:", active_players)
+    print("High scorers (>2000):", result["high_scorers"])
+    print("Scores doubled:", result["scores_doubled"])
+    print("Active players:", result["active_players"])
     print()
 
     player_scores = {
-        player: scores[players.index(player)]
-        for player in active_players
-    }
-
-    score_categories = {
-        'high': sum(1 for s in scores if s > 2000),
-        'medium': sum(1 for s in scores if 1500 <= s <= 2000),
-        'low': sum(1 for s in scores if s < 1500)
+        player: table.column("score")[table.index[player]]
+        for player in result["active_players"]
     }
-    achievement_counts = {player: len(ach) for player,
-                          ach in achievements.items()}
 
     print("=== Dict Comprehension Examples ===")
     print("Player scores:", player_scores)
-    print("Score categories:", score_categories)
-    print("Achievement counts:", achievement_counts)
+    print("Score categories:", result["score_categories"])
+    print("Achievement counts:", result["achievement_counts"])
     print()
 
-    unique_players = {player for player in players}
-    unique_achievements = {ach for ach_list in achievements.values()
-                           for ach in ach_list}
-    active_regions = {region for region in regions}
-
     print("=== Set Comprehension Examples ===")
-    print("Unique players:", unique_players)
-    print("Unique achievements:", unique_achievements)
-    print("Active regions:", active_regions)
+    print("Unique players:", result["unique_players"])
+    print("Unique achievements:", result["unique_achievements"])
+    print("Active regions:", result["active_regions"])
     print()
 
-    total_players = len(players)
-    total_unique_achievements = len(unique_achievements)
-    average_score = sum(scores) / len(scores)
-    top_index = scores.index(max(scores))
-    top_performer = players[top_index]
-    top_achievements = len(achievements[top_performer])
-
     print("=== Combined Analysis ===")
-    print("Total players:", total_players)
-    print("Total unique achievements:", total_unique_achievements)
-    print(f"Average score: {average_score}")
-    print(f"Top performer: {top_performer} ({scores[top_index]} points, "
-          f"{top_achievements} achievements)")
+    print("Total players:", len(table))
+    print("Total unique achievements:", len(result["unique_achievements"]))
+    print(f"Average score: {result['average_score']}")
+    print(f"Top performer: {result['top_performer']} "
+          f"({result['top_score']} points, "
+          f"{result['top_achievements']} achievements)")
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
@@ -1,3 +1,132 @@
+import mmap
+import os
+import stat
+import sys
+import time
+
+CHUNK_SIZE = 1 << 20
+
+
+def stream_archive(path: str, out=None, chunk_size: int = CHUNK_SIZE) -> int:
+    if out is None:
+        out = sys.stdout.buffer
+    with open(path, "rb") as f:
+        out.flush()
+        try:
+            out_fd = out.fileno()
+        except (AttributeError, OSError):
+            out_fd = None
+        # st_size is 0 for /proc files, FIFOs and <(cmd); only regular files
+        # go through sendfile, which then runs until it reports EOF
+        regular = stat.S_ISREG(os.fstat(f.fileno()).st_mode)
+        if regular and out_fd is not None and hasattr(os, "sendfile"):
+            sent = 0
+            try:
+                while True:
+                    n = os.sendfile(out_fd, f.fileno(), sent, chunk_size)
+                    if n == 0:
+                        return sent
+                    sent += n
+            except OSError:
+                if sent:
+                    raise
+                f.seek(0)
+        copied = 0
+        while chunk := f.read(chunk_size):
+            out.write(chunk)
+            copied += len(chunk)
+        return copied
+
+
+def read_excerpt(path: str, start: int = 0, end: int | None = None) -> bytes:
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # /proc files report size 0 and pipes have no size; read those
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            if end is not None and end < 0:
+                return b""
+            data = f.read(end if end is not None and start >= 0 else -1)
+            return data[start:end]
+        size = st.st_size
+        if end is None or end > size:
+            end = size
+        if start < 0:
+            start = max(size + start, 0)
+        if start >= end:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m[start:end]
+
+
+def head(path: str, n_bytes: int) -> bytes:
+    return read_excerpt(path, 0, n_bytes)
+
+
+def tail(path: str, n_bytes: int) -> bytes:
+    if n_bytes <= 0:
+        return b""
+    return read_excerpt(path, -n_bytes)
+
+
+def _line_copy(path: str, out) -> None:
+    with open(path, "r") as f:
+        for line in f:
+            print(line, end="", file=out)
+
+
+def benchmark(path: str | None = None, size_mb: int = 256) -> None:
+    created = path is None
+    if created:
+        path = "benchmark_fragment.txt"
+        line = b"[FRAGMENT] Ancient data recovered from the cyber archives\n"
+        block = line * (CHUNK_SIZE // len(line))
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(block)
+    size = os.path.getsize(path)
+    print(f"=== RECOVERY BENCHMARK: {path} ({size / 1e6:.1f} MB) ===")
+    try:
+        for name, copy in (("line loop", _line_copy),
+                           ("chunked stream", stream_archive)):
+            mode = "w" if copy is _line_copy else "wb"
+            with open(os.devnull, mode) as out:
+                start = time.perf_counter()
+                copy(path, out)
+                elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed:.3f}s ({size / 1e6 / elapsed:.1f} MB/s)")
+        start = time.perf_counter()
+        for i in range(1000):
+            offset = (i * 7919 * 4096) % size
+            read_excerpt(path, offset, offset + 4096)
+        elapsed = time.perf_counter() - start
+        print(f"mmap excerpts: {elapsed / 1000 * 1e6:.1f}us per lookup")
+    finally:
+        if created:
+            os.remove(path)
+
+
+def recovery_mode(args: list[str]) -> None:
+    path = args[0]
+    try:
+        if len(args) == 1:
+            stream_archive(path)
+        elif args[1] == "--head" and len(args) == 3:
+            sys.stdout.buffer.write(head(path, int(args[2])))
+        elif args[1] == "--tail" and len(args) == 3:
+            sys.stdout.buffer.write(tail(path, int(args[2])))
+        elif args[1] == "--range" and len(args) == 3:
+            start, end = args[2].split(":")
+            sys.stdout.buffer.write(read_excerpt(path, int(start), int(end)))
+        else:
+            print("Usage: python3 ft_ancient_text.py <path> "
+                  "[--head N | --tail N | --range START:END]")
+        sys.stdout.flush()
+    except FileNotFoundError:
+        print(f"missing {path}")
+    except ValueError as e:
+        print(f"ERROR: invalid excerpt bounds: {e}")
+    except OSError as e:
+        print(f"ERROR: cannot recover {path}: {e.strerror or e}")
 
 
 def main():
@@ -15,4 +144,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*sys.argv[2:3])
+    elif len(sys.argv) > 1:
+        recovery_mode(sys.argv[1:])
+    else:
+        main()
@@ -1,4 +1,138 @@
+import os
+import re
 import sys
+import time
+
+BLOCK_SIZE = 1 << 20
+
+
+STANDARD_PREFIX = b"[STANDARD] Archive status from "
+ALERT_PREFIX = b"[ALERT] Archive status from "
+MALFORMED_RECORD = re.compile(rb"\n(?=[^:\n]*\n)")
+# same whitespace set as bytes.lstrip() in _route (no \n inside a record)
+ALERT_STATUS = re.compile(rb":[ \t\r\x0b\x0c]*ALERT")
+NOT_SEPARATOR = bytes(range(256)).translate(None, b":\n")
+
+
+def _route(lines: list[bytes], out: list[bytes], alerts: list[bytes]) -> int:
+    records = 0
+    for line in lines:
+        archivist_id, sep, status = line.partition(b":")
+        if not sep:
+            if line.strip():
+                alerts.append(b"[ALERT] Malformed status record: %s\n"
+                              % line)
+                records += 1
+            continue
+        records += 1
+        if status.lstrip().startswith(b"ALERT"):
+            alerts.append(ALERT_PREFIX + line + b"\n")
+        else:
+            out.append(STANDARD_PREFIX + line + b"\n")
+    return records
+
+
+def _standard_run(text: bytes) -> bytes:
+    return (STANDARD_PREFIX
+            + text.replace(b"\n", b"\n" + STANDARD_PREFIX) + b"\n")
+
+
+def _process_block(text: bytes, out, err) -> tuple[int, int]:
+    padded = b"\n" + text + b"\n"
+    specials = set()
+    if b"\n\n" in padded.translate(None, NOT_SEPARATOR):
+        specials.update(m.start() for m in MALFORMED_RECORD.finditer(padded))
+    for m in ALERT_STATUS.finditer(padded):
+        start = padded.rfind(b"\n", 0, m.start())
+        if padded.find(b":", start) == m.start():
+            specials.add(start)
+    if not specials:
+        out.write(_standard_run(text))
+        return text.count(b"\n") + 1, 0
+    standard: list[bytes] = []
+    alerts: list[bytes] = []
+    records = pos = 0
+    for start in sorted(specials):
+        if start > pos:
+            run = padded[pos + 1:start]
+            standard.append(_standard_run(run))
+            records += run.count(b"\n") + 1
+        pos = padded.find(b"\n", start + 1)
+        records += _route([padded[start + 1:pos]], standard, alerts)
+    if pos < len(padded) - 1:
+        run = padded[pos + 1:-1]
+        standard.append(_standard_run(run))
+        records += run.count(b"\n") + 1
+    out.write(b"".join(standard))
+    if alerts:
+        err.write(b"".join(alerts))
+    return records, len(alerts)
+
+
+def pipe_mode(inp=None, out=None, err=None,
+              block_size: int = BLOCK_SIZE) -> tuple[int, int]:
+    inp = inp or sys.stdin.buffer
+    out = out or sys.stdout.buffer
+    err = err or sys.stderr.buffer
+    pending = b""
+    records = alert_count = 0
+    while True:
+        chunk = inp.read(block_size)
+        if not chunk:
+            break
+        data = pending + chunk
+        cut = data.rfind(b"\n")
+        if cut == -1:
+            pending = data
+            continue
+        pending = data[cut + 1:]
+        n, alerts = _process_block(data[:cut], out, err)
+        records += n
+        alert_count += alerts
+    if pending:
+        n, alerts = _process_block(pending, out, err)
+        records += n
+        alert_count += alerts
+    out.flush()
+    err.flush()
+    return records, alert_count
+
+
+def run_pipe_mode() -> None:
+    try:
+        pipe_mode()
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+
+
+def benchmark(size_mb: int = 256) -> None:
+    path = "benchmark_status.txt"
+    block = b"".join(
+        b"archivist_%05d:%s\n" % (
+            i,
+            b"ALERT vault breach" if i % 100 == 0
+            else b"Cataloguing ancient fragments",
+        )
+        for i in range(20000))
+    with open(path, "wb") as f:
+        for _ in range(size_mb * (1 << 20) // len(block)):
+            f.write(block)
+    size = os.path.getsize(path)
+    try:
+        with open(path, "rb") as inp, open(os.devnull, "wb") as out, \
+                open(os.devnull, "wb") as err:
+            start = time.perf_counter()
+            records, alerts = pipe_mode(inp, out, err)
+            elapsed = time.perf_counter() - start
+        print(f"=== PIPE MODE BENCHMARK: {size / 1e6:.1f} MB ===")
+        print(f"{records} records, {alerts} alerts in {elapsed:.3f}s "
+              f"({size / 1e6 / elapsed:.1f} MB/s)")
+        print("Compare with: cat <file> | python3 ft_stream_management.py "
+              "--pipe > /dev/null")
+    finally:
+        os.remove(path)
 
 
 def main():
@@ -19,4 +153,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--pipe":
+        run_pipe_mode()
+    elif len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        main()
@@ -1,3 +1,188 @@
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from typing import Iterable, Iterator
+
+MARKERS = (b"[CLASSIFIED]",)
+INDEX_MAGIC = b"FTVAULT1"
+INDEX_HEADER = struct.Struct("<8sQQI")
+MARKER_HEADER = struct.Struct("<HQ")
+
+
+class Vault:
+    def __init__(self, path: str, markers: Iterable[bytes] = MARKERS,
+                 index_path: str | None = None, writable: bool = False):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self._file = open(path, "r+b" if writable else "rb")
+        self._map: mmap.mmap | None = None
+        self._remap()
+        self.index: dict[bytes, array] = {}
+        if not self._load_index():
+            self.index = {}
+        missing = [m for m in markers if m not in self.index]
+        if missing:
+            for marker in missing:
+                self.index[marker] = self._scan(marker)
+            self._save_index()
+
+    def _remap(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        size = os.fstat(self._file.fileno()).st_size
+        self._map = (mmap.mmap(self._file.fileno(), 0,
+                               access=mmap.ACCESS_READ) if size else None)
+        self.size = size
+
+    def _scan(self, marker: bytes) -> array:
+        offsets = array("Q")
+        m = self._map
+        if m is None:
+            return offsets
+        pos = m.find(marker)
+        while pos != -1:
+            if pos == 0 or m[pos - 1] == 10:
+                offsets.append(pos)
+            pos = m.find(marker, pos + 1)
+        return offsets
+
+    def _stamp(self) -> tuple[int, int]:
+        st = os.fstat(self._file.fileno())
+        return st.st_size, st.st_mtime_ns
+
+    def _load_index(self) -> bool:
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, size, mtime, count = INDEX_HEADER.unpack(
+                    f.read(INDEX_HEADER.size))
+                if magic != INDEX_MAGIC or (size, mtime) != self._stamp():
+                    return False
+                for _ in range(count):
+                    length, n = MARKER_HEADER.unpack(
+                        f.read(MARKER_HEADER.size))
+                    marker = f.read(length)
+                    offsets = array("Q")
+                    offsets.fromfile(f, n)
+                    self.index[marker] = offsets
+        except (OSError, EOFError, struct.error):
+            return False
+        return True
+
+    def _save_index(self) -> None:
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, *self._stamp(),
+                                          len(self.index)))
+                for marker, offsets in self.index.items():
+                    f.write(MARKER_HEADER.pack(len(marker), len(offsets)))
+                    f.write(marker)
+                    offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            print("SECURITY ALERT: Vault index could not be preserved",
+                  file=sys.stderr)
+
+    def count(self, marker: bytes = MARKERS[0]) -> int:
+        return len(self._offsets(marker))
+
+    def _offsets(self, marker: bytes) -> array:
+        if marker not in self.index:
+            self.index[marker] = self._scan(marker)
+            self._save_index()
+        return self.index[marker]
+
+    def record(self, n: int, marker: bytes = MARKERS[0]) -> str:
+        start = self._offsets(marker)[n]
+        end = self._map.find(b"\n", start)
+        if end == -1:
+            end = self.size
+        return self._map[start:end].decode()
+
+    def records(self, marker: bytes = MARKERS[0]) -> Iterator[str]:
+        for n in range(self.count(marker)):
+            yield self.record(n, marker)
+
+    def search(self, text: bytes) -> int:
+        return -1 if self._map is None else self._map.find(text)
+
+    def append(self, lines: Iterable[str]) -> None:
+        # one record per line; the index only looks at line starts
+        records = [line.encode() + b"\n" for line in lines]
+        if any(b"\n" in data[:-1] for data in records):
+            raise ValueError("Vault records cannot contain newlines")
+        self._file.seek(0, os.SEEK_END)
+        pos = self._file.tell()
+        if pos != self.size:
+            # grown behind our back: remap and rebuild the stale offsets
+            self._remap()
+            self.index = {marker: self._scan(marker) for marker in self.index}
+        if pos and self._map is not None and self._map[pos - 1] != 10:
+            self._file.write(b"\n")
+            pos += 1
+        for data in records:
+            for marker, offsets in self.index.items():
+                if data.startswith(marker):
+                    offsets.append(pos)
+            self._file.write(data)
+            pos += len(data)
+        self._file.flush()
+        self._remap()
+        self._save_index()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "Vault":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def benchmark(path: str | None = None, size_mb: int = 512) -> None:
+    created = path is None
+    if created:
+        path = "benchmark_vault.txt"
+        block = b"".join(
+            (b"[CLASSIFIED] Record %07d sealed\n" if i % 10 == 0
+             else b"[PUBLIC] Routine log line %07d\n") % i
+            for i in range(20000))
+        with open(path, "wb") as f:
+            for _ in range(size_mb * (1 << 20) // len(block)):
+                f.write(block)
+    print(f"=== VAULT BENCHMARK: {path} "
+          f"({os.path.getsize(path) / 1e6:.1f} MB) ===")
+    try:
+        if os.path.exists(path + ".idx"):
+            os.remove(path + ".idx")
+        start = time.perf_counter()
+        vault = Vault(path)
+        print(f"Index build: {time.perf_counter() - start:.3f}s "
+              f"({vault.count()} records)")
+        vault.close()
+        start = time.perf_counter()
+        vault = Vault(path)
+        print(f"Index load: {(time.perf_counter() - start) * 1e3:.2f}ms")
+        total = vault.count()
+        start = time.perf_counter()
+        for i in range(10000):
+            vault.record(i * 7919 % total)
+        elapsed = time.perf_counter() - start
+        print(f"Record lookup: {elapsed / 10000 * 1e6:.2f}us")
+        vault.close()
+    finally:
+        if created:
+            os.remove(path)
+            os.remove(path + ".idx")
+
+
 def main():
     print("=== CYBER ARCHIVES - VAULT SECURITY SYSTEM ===\n")
     print("Initiating secure vault access...")
@@ -24,4 +209,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bench":
+        benchmark(*sys.argv[2:3])
+    else:
+        main()
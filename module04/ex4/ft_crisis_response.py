@@ -1,3 +1,57 @@
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+MAX_BYTES = 4096
+WORKERS = 32
+
+
+def recover_archive(filename: str, max_bytes: int = MAX_BYTES) -> dict:
+    try:
+        with open(filename, "rb") as f:
+            data = f.read(max_bytes + 1)
+        content = data[:max_bytes].decode("utf-8", errors="replace")
+        return {"file": filename, "status": "recovered",
+                "content": content.strip(),
+                "truncated": len(data) > max_bytes}
+    except FileNotFoundError:
+        return {"file": filename, "status": "not_found"}
+    except PermissionError:
+        return {"file": filename, "status": "permission_denied"}
+    except Exception as e:
+        return {"file": filename, "status": "anomaly",
+                "error": f"{type(e).__name__}: {e}"}
+
+
+def batch_recover(filenames: list[str], max_bytes: int = MAX_BYTES,
+                  workers: int = WORKERS,
+                  compare_sequential: bool = False) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "counts": {"recovered": 0, "not_found": 0,
+                   "permission_denied": 0, "anomaly": 0},
+    }
+    if compare_sequential:
+        # an untimed pass warms the page cache so both timed passes see
+        # the same cache state; the sequential one runs first
+        for name in filenames:
+            recover_archive(name, max_bytes)
+        start = time.perf_counter()
+        for name in filenames:
+            recover_archive(name, max_bytes)
+        report["sequential_time"] = time.perf_counter() - start
+        report["warm_cache"] = True
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda name: recover_archive(name, max_bytes),
+                                filenames))
+    report["wall_time"] = time.perf_counter() - start
+    report["results"] = results
+    for result in results:
+        report["counts"][result["status"]] += 1
+    return report
+
+
 def crisis_handler(filename):
     if filename == "standard_archive.txt":
         print(f"ROUTINE ACCESS: Attempting access to '{filename}'...")
@@ -39,5 +93,18 @@ def main():
     print("All crisis scenarios handled successfully. Archives secure.")
 
 
+def sweep_mode(filenames: list[str]) -> None:
+    report = batch_recover(filenames, compare_sequential=True)
+    print("=== CYBER ARCHIVES - BATCH RECOVERY SWEEP ===")
+    for status, count in report["counts"].items():
+        print(f"{status}: {count}")
+    print(f"Sequential sweep (warm cache): "
+          f"{report['sequential_time']:.3f}s")
+    print(f"Parallel sweep (warm cache): {report['wall_time']:.3f}s")
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1:
+        sweep_mode(sys.argv[1:])
+    else:
+        main()